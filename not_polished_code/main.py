@@ -139,11 +139,11 @@ if __name__ == "__main__":
 
     # Example assignment {x1=True, x2=False, x3=True, x4=False}
     sat_assignment = {1: True, 2: True, 3: False, 4: False}
-    independent_set = reduction.sol1tosol2(sat_assignment)
+    independent_set = reduction.solution1_to_solution2(sat_assignment)
 
     print("\nIndependent Set:", independent_set)
 
-    recovered_assignment = reduction.sol2tosol1(independent_set)
+    recovered_assignment = reduction.solution2_to_solution1(independent_set)
     print("\nRecovered SAT Assignment:", recovered_assignment)
 
     IS_result = reduction.is_independent_set(independent_set)
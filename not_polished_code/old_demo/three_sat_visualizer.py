@@ -1,21 +1,24 @@
 import math
+import numpy as np
 import pygame
-from three_sat_reduction import ThreeSatToIndependentSetReduction
 
-# Basic PyGame / drawing constants
-WIDTH, HEIGHT = 800, 600
+HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+]
+
 # Colors for visualization
 BACKGROUND_COLOR = (255, 255, 255)  # White background
 NODE_COLOR = (34,139,34)  # Blue nodes (adjust as needed)
 EDGE_COLOR = (0, 0, 0)  # Black edges
-LABEL_COLOR = (0, 0, 0)  # Black text for visibility
 HIGHLIGHT_NODE_COLOR = (255, 100, 100)  # Red highlight for selected nodes
-HIGHLIGHT_COLOR = (255, 100, 100)  # Red highlight for selected nodes
 
 RADIUS = 20
 
 class ThreeSatGraphVisualizer:
-    def __init__(self, graph, clause_vertices, formula, literal_to_formula_indices, literal_id_to_node_id, reduction, width=1000, height=700):
+    def __init__(self, graph, clause_vertices, formula, literal_to_formula_indices, literal_id_to_node_id, reduction, width=1000, height=700, debug=False):
         """
         Args:
             graph: NetworkX graph containing 3-SAT nodes/edges.
@@ -24,8 +27,15 @@ class ThreeSatGraphVisualizer:
             literal_to_formula_indices: Mapping from (var, neg) to positions in formula for highlighting.
             width: Width of the PyGame window.
             height: Height of the PyGame window.
+            debug: Print click and highlight tracing to stdout.
         """
+        self.DEBUG = debug  # gates the per-click tracing prints
         self.graph = graph
+        # The graph is not modified while visualizing, so snapshot what the
+        # draw and click paths need instead of going through NetworkX each time
+        self._nodes = list(graph.nodes())
+        self._edges = list(graph.edges())
+        self._literals = {n: data['literal'] for n, data in graph.nodes(data=True)}
         self.clause_vertices = clause_vertices
         self.formula = formula
         self.literal_to_formula_indices = literal_to_formula_indices  # Mapping for highlighting
@@ -37,20 +47,143 @@ class ThreeSatGraphVisualizer:
 
         # Initialize PyGame
         pygame.init()
+        # Only let SDL queue what _handle_event reacts to; mouse motion and
+        # the rest are dropped before they ever reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("3-SAT Graph Visualizer")
-        self.clock = pygame.time.Clock()
+
+        # Fonts are built once here; SysFont lookups are too slow for every frame
+        self._node_font = pygame.font.SysFont(None, 24)
+        self._formula_font = pygame.font.SysFont(None, 32, bold=False)
+        self._text_cache = {}  # (font, text, color) -> rendered surface
+        self._formula_surface_cache = {}  # highlight state -> composited formula line
 
         
         self.node_highlight = None  # Keeps track of which node is selected
         self.edge_highlight = None  # Keeps track of which edge is selected
         self.highlighted_literals = set()  # Stores which literals to highlight in the formula
         self.highlighted_operators = set()  # ✅ Stores the clause indices where `∨` should be highlighted
+        self._literal_positions = None  # literal -> [(clause_idx, lit_idx)], built on first click
 
 
         # Compute layout
         self.pos = self._layout_clauses(start_x=150, start_y=350, x_gap=250, radius=80)
+        # The same positions as parallel coordinate arrays, in `_nodes` order,
+        # for the checks that run against every node at once
+        self._node_index = {node: i for i, node in enumerate(self._nodes)}
+        self._px = np.array([self.pos[node][0] for node in self._nodes], dtype=float)
+        self._py = np.array([self.pos[node][1] for node in self._nodes], dtype=float)
         self.running = True
+        self._dirty = True  # the scene is only redrawn when something changed
+        self._full_redraw = True  # present the whole window rather than just the changed regions
+        self._shown_rects = []  # regions the last presented highlight covered
+
+        # Positions never change after layout, so each edge's shape is worked out once
+        self._edge_info = self._compute_edge_info()
+        self._build_edge_arrays()
+        # ...and so is the grid used to find which node a click landed on
+        self._node_grid = self._build_node_grid()
+        # ...and each node's center, label and label rect, kept as parallel lists
+        self._node_xy = [self.pos[node] for node in self._nodes]
+        self._node_labels = [self._get_text(f"¬x{var_idx}" if neg else f"x{var_idx}", (0, 0, 0), self._node_font)
+                             for var_idx, neg, _ in (self._literals[node] for node in self._nodes)]
+        self._label_rects = [label.get_rect(center=xy) for label, xy in zip(self._node_labels, self._node_xy)]
+        self._node_rects = [pygame.Rect(x - 25, y - 25, 51, 51) for x, y in self._node_xy]
+
+        # Everything but the formula and the highlights is drawn once, up front
+        self._background = self._render_background()
+
+        # Pre-render every formula token in both its normal and highlighted color
+        for clause in self.formula:
+            for var, neg, _ in clause:
+                for color in ((0, 0, 0), (255, 0, 0)):
+                    self._get_text(f"¬x{var}" if neg else f"x{var}", color)
+        for token in ("AND", "OR", "(", ")"):
+            for color in ((0, 0, 0), (255, 0, 0)):
+                self._get_text(token, color)
+
+    def _compute_edge_info(self):
+        """
+        For every edge (u, v): whether it must curve around another node, its
+        Bezier control point, the sampled polyline to draw and its endpoints.
+        """
+        edge_info = {}
+        for u, v in self._edges:
+            x1, y1 = self.pos[u]
+            x2, y2 = self.pos[v]
+            line = (y2 - y1, x2 - x1, x2 * y1 - y2 * x1, math.hypot(y2 - y1, x2 - x1))
+            info = {'curved': self._is_curved_edge(u, v, line),
+                    'endpoints': ((x1, y1), (x2, y2)),
+                    'line': line}
+            if info['curved']:
+                control = self._get_control_point(x1, y1, x2, y2)
+                info['ctrl'] = control
+                info['points'] = [(int(x), int(y)) for x, y in bezier_points((x1, y1), control, (x2, y2))]
+            points = info['points'] if info['curved'] else info['endpoints']
+            xs = [p[0] for p in points]
+            ys = [p[1] for p in points]
+            rect = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+            info['rect'] = rect.inflate(6, 6)  # room for the 2 px line width
+            edge_info[(u, v)] = info
+        return edge_info
+
+    def _build_edge_arrays(self, cell=64):
+        """
+        Packs the straight edges' endpoints into NumPy arrays so a click can be
+        tested against many of them at once (`_seg_row` maps an edge index to
+        its row, -1 for curved edges, which keep the closed-form test), and
+        buckets every edge into the `cell`-sized grid squares its bounding box,
+        grown by the 15 px click threshold, overlaps. `_edge_keys` fixes the
+        order edges are reported in.
+        """
+        self._edge_keys = list(self._edge_info)
+        straight = [i for i, key in enumerate(self._edge_keys) if not self._edge_info[key]['curved']]
+        self._seg_row = np.full(len(self._edge_keys), -1, dtype=np.intp)
+        self._seg_row[straight] = np.arange(len(straight))
+        endpoints = np.array([self._edge_info[self._edge_keys[i]]['endpoints'] for i in straight],
+                             dtype=float).reshape(-1, 2, 2)
+        self._seg_start = endpoints[:, 0]
+        self._seg_delta = endpoints[:, 1] - endpoints[:, 0]
+        self._seg_len_sq = (self._seg_delta ** 2).sum(axis=1)
+
+        self._edge_cell = cell
+        self._edge_grid = {}  # (cx, cy) -> edge indices, ascending
+        # (left, top, right, bottom) per edge: its bounding box plus the threshold
+        self._edge_bbox = np.zeros((len(self._edge_keys), 4), dtype=np.intp)
+        for i, key in enumerate(self._edge_keys):
+            rect = self._edge_info[key]['rect'].inflate(2 * 16, 2 * 16)
+            self._edge_bbox[i] = rect.left, rect.top, rect.right, rect.bottom
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    self._edge_grid.setdefault((cx, cy), []).append(i)
+
+    def _build_node_grid(self, cell=50):
+        """
+        Buckets nodes into square cells of side `cell` (one node diameter), so
+        a click only needs to be checked against nodes in the 3x3 cells around
+        it. Each entry keeps the node's position in `self._nodes` so overlaps
+        resolve the same way a linear scan would.
+        """
+        grid = {}
+        for order, node in enumerate(self._nodes):
+            x, y = self.pos[node]
+            grid.setdefault((int(x // cell), int(y // cell)), []).append((order, node, x, y))
+        return grid
+
+    def _get_text(self, text, color, font=None):
+        """
+        Returns the rendered surface for `text`, rasterizing it only the first
+        time a given (font, text, color) is requested.
+        """
+        font = font or self._formula_font
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # match the display's pixel format so blits take the fast path
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
 
 
     def _layout_clauses(self, start_x=150, start_y=350, x_gap=250, radius=80):
@@ -58,17 +191,22 @@ class ThreeSatGraphVisualizer:
         Layout function that places each clause as a triangle.
         """
         pos = {}
+        offsets = {}  # clause width -> (x_offsets, y_offsets) around the clause center
         for c_idx, clause in enumerate(self.formula):
             center_x = start_x + c_idx * x_gap
             center_y = start_y
 
             n_lits = len(clause)
-            for i, node_id in enumerate(self.clause_vertices[c_idx]):
-                angle = 2 * math.pi * i / n_lits
-                x_offset = radius * math.cos(angle)
-                y_offset = radius * math.sin(angle)
+            if n_lits not in offsets:
+                angles = 2 * np.pi * np.arange(n_lits) / n_lits
+                offsets[n_lits] = (radius * np.cos(angles), radius * np.sin(angles))
+            x_offsets, y_offsets = offsets[n_lits]
 
-                pos[node_id] = (center_x + x_offset, center_y + y_offset)
+            # Whole pixels: pygame rasterizes at integer coordinates anyway
+            xs = np.rint(center_x + x_offsets).astype(int).tolist()
+            ys = np.rint(center_y + y_offsets).astype(int).tolist()
+            for node_id, x, y in zip(self.clause_vertices[c_idx], xs, ys):
+                pos[node_id] = (x, y)
 
         return pos
 
@@ -77,58 +215,82 @@ class ThreeSatGraphVisualizer:
         Main event loop for visualization.
         """
         while self.running:
+            if not self._dirty:
+                # Nothing to redraw: sleep until SDL has an event for us
+                self._handle_event(pygame.event.wait())
             self._handle_events()
-            self._draw_scene()
-            pygame.display.flip()
-            self.clock.tick(30)
+            if self._dirty:
+                self._draw_scene()
+                rects = self._highlight_rects()
+                if self._full_redraw:
+                    pygame.display.flip()
+                    self._full_redraw = False
+                else:
+                    # Only the previous and the new highlight can differ on screen
+                    pygame.display.update(self._shown_rects + rects)
+                self._shown_rects = rects
+                self._dirty = False
 
         pygame.quit()
 
 
+    def _highlight_rects(self):
+        """
+        Screen regions that depend on the current selection: the formula line
+        and the bounding boxes of the highlighted node and edge.
+        """
+        rects = [pygame.Rect(0, 0, self.width, 30 + self._formula_font.get_linesize())]
+        if self.node_highlight is not None:
+            x, y = self.pos[self.node_highlight]
+            rects.append(pygame.Rect(x - 26, y - 26, 53, 53))
+        if self.edge_highlight is not None:
+            u, v = self.edge_highlight
+            info = self._edge_info.get((u, v)) or self._edge_info.get((v, u))
+            if info is not None:
+                rects.append(info['rect'])
+        return rects
+
     def _handle_events(self):
         """
         Handles user interactions, distinguishing between node and edge clicks.
+        Drains everything queued in one batch.
         """
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+            self._handle_event(event)
+
+    def _handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._dirty = True  # window contents were lost
+            self._full_redraw = True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            mouse_pos = pygame.mouse.get_pos()
+            if self.DEBUG:
                 print("Mouse clicked at:", mouse_pos)  # ✅ Debugging click events
 
-                # First, check if a node was clicked
-                clicked_node = self._handle_node_click(mouse_pos)
-                
-                if clicked_node is None:
-                    # If no node was clicked, check for an edge click
-                    self._handle_edge_click(mouse_pos)
-                else:
-                    # ✅ Node was clicked, so don't process edge clicks
-                    self.edge_highlight = None  
-
-    # def _handle_node_click(self, mouse_pos):
-    #     """
-    #     Detects if a user clicks on a node and highlights it.
-    #     Calls `_update_highlighted_literals()` to highlight the corresponding literal in the formula.
-    #     """
-    #     mx, my = mouse_pos
-    #     for node in self.graph.nodes():
-    #         x, y = self.pos[node]
+            before = self._selection_state()
 
-    #         # Check if the click is inside the node (circle with radius 25)
-    #         if math.sqrt((mx - x) ** 2 + (my - y) ** 2) < 25:
-    #             print(f"Node clicked: {node}")  # ✅ Debugging node clicks
-    #             self.node_highlight = node  # ✅ Store highlighted node
-
-    #             # ✅ Update highlighted literals
-    #             lit = self.graph.nodes[node]["literal"]
-    #             self._update_highlighted_literals([lit])
+            # First, check if a node was clicked
+            clicked_node = self._handle_node_click(mouse_pos)
+            
+            if clicked_node is None:
+                # If no node was clicked, check for an edge click
+                self._handle_edge_click(mouse_pos)
+            else:
+                # ✅ Node was clicked, so don't process edge clicks
+                self.edge_highlight = None  
 
-    #             return node  # ✅ Return the clicked node
+            # Clicking empty space, or the same thing again, needs no redraw
+            if self._selection_state() != before:
+                self._dirty = True
 
-    #     self.node_highlight = None  # ✅ If no node clicked, clear highlight
-    #     self.highlighted_literals.clear()  # ✅ Clear formula highlights when clicking empty space
-    #     return None
+    def _selection_state(self):
+        """
+        Everything a click can change on screen.
+        """
+        return (self.node_highlight, self.edge_highlight,
+                frozenset(self.highlighted_literals), frozenset(self.highlighted_operators))
 
     def _handle_node_click(self, mouse_pos):
         """
@@ -136,22 +298,27 @@ class ThreeSatGraphVisualizer:
         Calls `_update_highlighted_literals()` to highlight the corresponding literal in the formula.
         """
         mx, my = mouse_pos
-        for node in self.graph.nodes():
-            x, y = self.pos[node]
-
-            # Check if the click is inside the node (circle with radius 25)
-            if math.sqrt((mx - x) ** 2 + (my - y) ** 2) < 25:
+        cx, cy = int(mx // 50), int(my // 50)
+        hit = None
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for order, node, x, y in self._node_grid.get((gx, gy), ()):
+                    # Check if the click is inside the node (circle with radius 25)
+                    if (mx - x) ** 2 + (my - y) ** 2 < 25 * 25 and (hit is None or order < hit[0]):
+                        hit = (order, node)
+
+        if hit is not None:
+            node = hit[1]
+            if self.DEBUG:
                 print(f"Node clicked: {node}")  # ✅ Debugging node clicks
-                self.node_highlight = node  # ✅ Store highlighted node
+            self.node_highlight = node  # ✅ Store highlighted node
 
-                # ✅ Extract the literal and its clause index
-                lit = self.graph.nodes[node]["literal"]
-                
-                self._update_highlighted_literals([lit])
-                # ✅ Pass the clause-specific literal to `_update_highlighted_literals()`
-                # self._update_highlighted_literals([(clause_idx, lit_idx)])
+            # ✅ Extract the literal and its clause index
+            lit = self._literals[node]
+            
+            self._update_highlighted_literals([lit])
 
-                return node  # ✅ Return the clicked node
+            return node  # ✅ Return the clicked node
 
         self.node_highlight = None  # ✅ If no node clicked, clear highlight
         self.highlighted_literals.clear()  # ✅ Clear formula highlights when clicking empty space
@@ -162,53 +329,68 @@ class ThreeSatGraphVisualizer:
         """
         Detects if a user clicks on an edge (curved or straight) and highlights it.
         """
-        mx, my = mouse_pos
         self.edge_highlight = None  # ✅ Reset edge highlight if no edge is clicked
         self.highlighted_literals.clear()  # ✅ Clear previous highlights
 
         closest_edge = None
-        min_distance = float('inf')
-
-        for u, v in self.graph.edges():
-            x1, y1 = self.pos[u]
-            x2, y2 = self.pos[v]
-
-            # ✅ Check if edge is curved
-            if self._is_curved_edge(u, v):
-                # ✅ Check click distance from Bezier curve
-                control_x, control_y = self._get_control_point(x1, y1, x2, y2)
-                distance = self._distance_to_bezier((x1, y1), (control_x, control_y), (x2, y2), (mx, my))
-            else:
-                # ✅ Use closest point detection for straight edges
-                px, py = self._closest_point_on_segment(x1, y1, x2, y2, mx, my)
-                if not self._is_between(x1, y1, x2, y2, px, py):
-                    continue
-                distance = math.sqrt((px - mx) ** 2 + (py - my) ** 2)
-
-            # ✅ Ensure click precision
-            if distance < min_distance and distance < 15:  # Adjust click precision threshold
-                min_distance = distance
-                closest_edge = (u, v)
+        # Only edges registered in the clicked grid cell can be within 15 px
+        mx, my = mouse_pos
+        candidates = np.array(self._edge_grid.get((int(mx // self._edge_cell), int(my // self._edge_cell)), ()),
+                              dtype=np.intp)
+        # Cheap test first: drop candidates whose grown bounding box misses the click
+        bbox = self._edge_bbox[candidates]
+        candidates = candidates[(bbox[:, 0] <= mx) & (mx < bbox[:, 2]) & (bbox[:, 1] <= my) & (my < bbox[:, 3])]
+        distance_sq = np.full(len(candidates), np.inf)
+        rows = self._seg_row[candidates]
+        straight = rows >= 0
+
+        # ✅ Use closest point detection for the straight candidates at once:
+        # project the click onto each segment and clamp to its endpoints
+        if straight.any():
+            rows = rows[straight]
+            start, delta, len_sq = self._seg_start[rows], self._seg_delta[rows], self._seg_len_sq[rows]
+            rel = np.array(mouse_pos, dtype=float) - start
+            t = np.divide((rel * delta).sum(axis=1), len_sq,
+                          out=np.zeros_like(len_sq), where=len_sq != 0)  # a zero-length edge is a point
+            closest = start + np.clip(t, 0, 1)[:, None] * delta
+            distance_sq[straight] = ((closest - mouse_pos) ** 2).sum(axis=1)
+
+        # ✅ Check click distance from each curved candidate's Bezier curve itself
+        for j in np.flatnonzero(~straight):
+            info = self._edge_info[self._edge_keys[candidates[j]]]
+            start, end = info['endpoints']
+            distance_sq[j] = bezier_distance_sq(start, info['ctrl'], end, mouse_pos)
+
+        # ✅ Ensure click precision (squared distances keep sqrt out of the test);
+        # candidates are in edge order, so argmin keeps the first edge on ties
+        if len(distance_sq):
+            best = int(np.argmin(distance_sq))
+            if distance_sq[best] < 15 * 15:
+                closest_edge = self._edge_keys[candidates[best]]
 
         if closest_edge:
             self.edge_highlight = closest_edge
-            print(f"Edge clicked: {closest_edge}")  # ✅ Debugging clicked edges
+            if self.DEBUG:
+                print(f"Edge clicked: {closest_edge}")  # ✅ Debugging clicked edges
 
             # ✅ Highlight corresponding literals in the formula
-            lit1 = self.graph.nodes[closest_edge[0]]["literal"]
-            lit2 = self.graph.nodes[closest_edge[1]]["literal"]
+            lit1 = self._literals[closest_edge[0]]
+            lit2 = self._literals[closest_edge[1]]
             self._update_highlighted_literals([lit1, lit2])
 
-    def _is_curved_edge(self, u, v):
+    def _is_curved_edge(self, u, v, line=None):
         """
         Determines if an edge between nodes u and v is curved.
+        `line` is the edge's (dy, dx, c, length), so the perpendicular distance
+        to each node is just abs(dy * x - dx * y + c) / length.
         """
-        for node in self.graph.nodes():
-            if node != u and node != v:
-                x, y = self.pos[node]
-                if self._is_edge_passing_through((self.pos[u], self.pos[v]), (x, y)):
-                    return True
-        return False
+        if line is None:
+            (x1, y1), (x2, y2) = self.pos[u], self.pos[v]
+            line = (y2 - y1, x2 - x1, x2 * y1 - y2 * x1, math.hypot(y2 - y1, x2 - x1))
+        dy, dx, c, length = line
+        near = np.abs(dy * self._px - dx * self._py + c) / length < 30  # nodes within 30 px of the line force a curve
+        near[[self._node_index[u], self._node_index[v]]] = False  # an edge never curves around its own ends
+        return bool(near.any())
 
 
     def _get_control_point(self, x1, y1, x2, y2):
@@ -217,207 +399,162 @@ class ThreeSatGraphVisualizer:
         """
         return (x1 + x2) / 2 + 40, (y1 + y2) / 2 - 40  # Offset for smooth curvature
 
-    def _distance_to_bezier(self, p0, p1, p2, click):
+    def _build_literal_positions(self):
         """
-        Computes the distance from a point (click) to a quadratic Bezier curve.
-        Uses iterative point sampling to approximate the closest distance.
+        Indexes the graph once: for each literal, every (clause_idx, lit_idx)
+        whose node carries it.
         """
-        min_dist = float('inf')
-        for t in range(0, 21):  # Sample along the Bezier curve
-            t /= 20.0
-            bx = (1 - t) ** 2 * p0[0] + 2 * (1 - t) * t * p1[0] + t ** 2 * p2[0]
-            by = (1 - t) ** 2 * p0[1] + 2 * (1 - t) * t * p1[1] + t ** 2 * p2[1]
-
-            dist = math.sqrt((bx - click[0]) ** 2 + (by - click[1]) ** 2)
-            if dist < min_dist:
-                min_dist = dist
+        literal_positions = {}
+        for (clause_idx, lit_idx), node_id in self.reduction.node_mapping.items():
+            node_literal = self.reduction.graph.nodes[node_id].get("literal", None)
+            literal_positions.setdefault(node_literal, []).append((clause_idx, lit_idx))
+        return literal_positions
 
-        return min_dist
-
-    def _is_edge_passing_through(self, edge, node_pos):
-        """
-        Checks if the given edge passes near the given node position.
+    def _update_highlighted_literals(self, literals):
         """
-        (x1, y1), (x2, y2) = edge  # Unpack edge endpoints
-        x, y = node_pos  # Node position
+        Updates `self.highlighted_literals` based on user interaction.
 
-        # Compute perpendicular distance from node to line
-        distance = abs((y2 - y1) * x - (x2 - x1) * y + x2 * y1 - y2 * x1) / math.sqrt((y2 - y1) ** 2 + (x2 - x1) ** 2)
-
-        return distance < 30  # ✅ Threshold for detecting close proximity (adjustable)
-
-
-    def _closest_point_on_segment(self, x1, y1, x2, y2, mx, my):
-        """
-        Finds the closest point on the line segment (x1, y1) -> (x2, y2) to the mouse click (mx, my).
-        """
-        dx, dy = x2 - x1, y2 - y1
-        if dx == 0 and dy == 0:
-            return x1, y1  # Edge is a point
-
-        # ✅ Compute the projection of (mx, my) onto the edge
-        t = ((mx - x1) * dx + (my - y1) * dy) / (dx * dx + dy * dy)
-
-        # ✅ Clamp `t` to the range [0, 1] to ensure it lies on the segment
-        t = max(0, min(1, t))
-
-        # ✅ Compute the closest point
-        px, py = x1 + t * dx, y1 + t * dy
-        return px, py
-
-    def _is_between(self, x1, y1, x2, y2, px, py):
-        """
-        Checks if the point (px, py) lies between (x1, y1) and (x2, y2).
-        """
-        return min(x1, x2) - 1 <= px <= max(x1, x2) + 1 and min(y1, y2) - 1 <= py <= max(y1, y2) + 1
-
-
-
-    def _update_highlighted_literals(self, literals, clicked_edge=None):
-        """
-        Updates `self.highlighted_literals` and `self.highlighted_operators` based on user interaction.
-
-        - If a node is clicked → Highlight only that literal.
-        - If an edge is clicked:
-        - If it's between opposite literals (x, ¬x), highlight both in all corresponding clauses.
-        - If it's between different literals (x1, x2), highlight only the `∨` operator between them.
+        - If a node is clicked → Highlight that literal in all occurrences.
+        - If an edge is clicked → Highlight both of its literals in all occurrences.
         """
         self.highlighted_literals.clear()  # Reset previous highlights
         self.highlighted_operators.clear()  # Reset highlighted `∨` operators
 
-        if clicked_edge:
-            lit1, lit2 = clicked_edge
+        if self._literal_positions is None:
+            self._literal_positions = self._build_literal_positions()
 
-            # ✅ If the edge is between a literal and its negation, highlight both occurrences
-            if lit1[0] == lit2[0] and lit1[1] != lit2[1]:  # Example: (x1, ¬x1)
-                var = lit1[0]
-                if (var, True) in self.reduction.assignment_mapping and (var, False) in self.reduction.assignment_mapping:
-                    u = self.reduction.assignment_mapping[(var, True)]
-                    v = self.reduction.assignment_mapping[(var, False)]
-                    for node in [u, v]:
-                        for (clause_idx, lit_idx), node_id in self.reduction.node_mapping.items():
-                            if node_id == node:
-                                self.highlighted_literals.add((clause_idx, lit_idx))
+        # ✅ Highlight each literal **in all occurrences**
+        for lit in literals:
+            positions = self._literal_positions.get(lit, [])
+            if self.DEBUG:
+                print(f"Literal {lit} found at {positions}")
+            self.highlighted_literals.update(positions)
 
-            else:
-                # ✅ If the edge is between different literals (x1, x2), highlight only the `∨` operator
-                for clause_idx, clause in enumerate(self.reduction.formula.clauses):
-                    indices = [i for i, lit in enumerate(clause) if lit in [lit1, lit2]]
-                    if len(indices) == 2:  # Ensure both literals exist in the same clause
-                        self.highlighted_operators.add((clause_idx, min(indices)))
-
-        else: # node clicked
-            # ✅ If a node is clicked, highlight **only that literal in all occurrences**
-            # for lit in literals:
-            #     for (clause_idx, lit_idx), node_id in self.reduction.node_mapping.items():
-            #         if self.reduction.graph.nodes[node_id]["literal"] == lit:
-            #             self.highlighted_literals.add((clause_idx, lit_idx))
-            for lit in literals:
-                print(f"Checking literal: {lit}")
-
-                for (clause_idx, lit_idx), node_id in self.reduction.node_mapping.items():
-                    node_literal = self.reduction.graph.nodes[node_id].get("literal", None)
-
-                    if node_literal:
-                        print(f"Comparing: searched {lit} vs stored {node_literal}")
-
-                    if node_literal == lit:
-                        print(f"Match found! Adding (clause_idx: {clause_idx}, lit_idx: {lit_idx}) to highlighted_literals")
-                        self.highlighted_literals.add((clause_idx, lit_idx))
-                    else:
-                        print(f"No match found. Expected {lit} but got {node_literal}")
-
-        print(f"Highlighted literals: {self.highlighted_literals}")
-        print(f"Highlighted operators: {self.highlighted_operators}")
+        if self.DEBUG:
+            print(f"Highlighted literals: {self.highlighted_literals}")
+            print(f"Highlighted operators: {self.highlighted_operators}")
 
    
+    def _render_background(self):
+        """
+        Renders the unhighlighted graph (black edges, blue nodes and their
+        labels on white) into an off-screen surface.
+        """
+        background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+        background.fill((255, 255, 255))  # White background
+        # lock once for the whole run of line and circle primitives instead
+        # of once per call; must be released before the label blits below
+        background.lock()
+        try:
+            for info in self._edge_info.values():
+                self._draw_edge(background, info, (0, 0, 0))
+            for xy in self._node_xy:
+                pygame.draw.circle(background, (50, 100, 255), xy, 25)
+        finally:
+            background.unlock()
+        background.blits(list(zip(self._node_labels, self._label_rects)), False)
+        return background
+
     def _draw_scene(self):
         """
         Draws the graph, curved edges, and the 3-CNF formula at the top of the screen.
         Highlights selected edges and literals when clicked.
+        Starts from the pre-rendered background and only draws what the
+        selection changes on top of it.
         """
-        self.screen.fill((255, 255, 255))  # White background
+        self.screen.blit(self._background, (0, 0))
 
         # ✅ Draw the 3-CNF Formula at the top of the screen
         self._draw_formula()
 
-        # ✅ Draw edges with curves where necessary
-        for u, v in self.graph.edges():
-            x1, y1 = self.pos[u]
-            x2, y2 = self.pos[v]
-
-            # Determine if the edge should be highlighted
-            is_highlighted = self.edge_highlight == (u, v) or self.edge_highlight == (v, u)
-            edge_color = (255, 0, 0) if is_highlighted else (0, 0, 0)  # Red if clicked, black otherwise
-
-            # Check if edge should be curved (if it passes near another node)
-            curve = False
-            for node in self.graph.nodes():
-                if node != u and node != v:
-                    x, y = self.pos[node]
-                    if is_edge_passing_through((x1, y1), (x2, y2), (x, y)):
-                        curve = True
-                        break
-
-            if curve:
-                # **Draw curved edge using Bezier curve**
-                control_x = (x1 + x2) / 2 + 40  # Offset control point for curve
-                control_y = (y1 + y2) / 2 - 40  # Offset to prevent overlap
-                draw_curved_edge(self.screen, (x1, y1), (x2, y2), (control_x, control_y), edge_color)
-            else:
-                # **Draw straight edge**
-                pygame.draw.line(self.screen, edge_color, (x1, y1), (x2, y2), 2)
+        redraw = set()  # indices of nodes that must be drawn again on top
+        if self.edge_highlight is not None:
+            u, v = self.edge_highlight
+            key = (u, v) if (u, v) in self._edge_info else (v, u)
+            if key in self._edge_info:
+                info = self._edge_info[key]
+                touched = [info['rect']]
+                self.screen.lock()
+                try:
+                    self._draw_edge(self.screen, info, (255, 0, 0))  # Red if clicked
+                    # Edges drawn after this one cover it where they cross, and
+                    # nodes are drawn over every edge: restore both on top of it
+                    later = False
+                    for other_key, other in self._edge_info.items():
+                        if later and other['rect'].colliderect(info['rect']):
+                            self._draw_edge(self.screen, other, (0, 0, 0))
+                            touched.append(other['rect'])
+                        later = later or other_key == key
+                finally:
+                    self.screen.unlock()
+                redraw.update(i for i, rect in enumerate(self._node_rects) if rect.collidelist(touched) != -1)
+
+        if self.node_highlight is not None:
+            redraw.add(self._node_index[self.node_highlight])
 
         # ✅ Draw nodes, with highlight effect if connected to selected edge
-        self._draw_nodes()
-
-        # ✅ Update display
-        pygame.display.flip()
-        
- 
-    def _draw_nodes(self):
-        """
-        Draws nodes with a different color if they are clicked.
-        """
-        for node in self.graph.nodes():
-            node_color = (255, 150, 0) if self.node_highlight == node else (50, 100, 255)  # Orange if clicked, Blue otherwise
-            pygame.draw.circle(self.screen, node_color, self.pos[node], 25)
-
-            lit = self.graph.nodes[node]['literal']
-            var_idx, neg, clause_id = lit
-            text_label = f"¬x{var_idx}" if neg else f"x{var_idx}"
-
-            font = pygame.font.SysFont(None, 24)
-            text_surface = font.render(text_label, True, (0, 0, 0))
-            text_rect = text_surface.get_rect(center=self.pos[node])
-            self.screen.blit(text_surface, text_rect)
-
-
+        if redraw:
+            self._draw_nodes(sorted(redraw))
+        # run() presents the frame, once
+
+    def _draw_edge(self, surface, info, color):
+        # Curved edges (passing near another node) were sampled in _compute_edge_info
+        if info['curved']:
+            # **Draw curved edge using Bezier curve**
+            pygame.draw.lines(surface, color, False, info['points'], 2)
+        else:
+            # **Draw straight edge**
+            start, end = info['endpoints']
+            pygame.draw.line(surface, color, start, end, 2)
+
+    def _draw_nodes(self, indices):
+        """
+        Draws the nodes at `indices` (into `self._nodes`) with a different color if they are clicked.
+        """
+        screen = self.screen
+        screen.lock()
+        try:
+            for i in indices:
+                node = self._nodes[i]
+                node_color = (255, 150, 0) if self.node_highlight == node else (50, 100, 255)  # Orange if clicked, Blue otherwise
+                pygame.draw.circle(screen, node_color, self._node_xy[i], 25)
+        finally:
+            screen.unlock()
+
+        # Labels never change, so they were laid out once in __init__
+        screen.blits([(self._node_labels[i], self._label_rects[i]) for i in indices], False)
 
     def _draw_formula(self):
         """
         Draws the horizontal 3-CNF formula at the top of the screen with proper brackets.
         - Highlights literals and operators based on user interaction.
         - Ensures `∨` and `∧` are properly spaced and aligned.
+        The whole line is composited once per highlight state and blitted in one go.
         """
-        font = pygame.font.SysFont(None, 32, bold=False)  # Use bold for better visibility
-        screen_width = self.screen.get_width()
+        key = (frozenset(self.highlighted_literals), frozenset(self.highlighted_operators))
+        surface = self._formula_surface_cache.get(key)
+        if surface is None:
+            surface = self._formula_surface_cache[key] = self._render_formula()
+        self.screen.blit(surface, (50, 30))  # Left margin, vertical position at the top
 
-        # ✅ Define starting position
-        x_start = 50  # Left margin for rendering formula
-        y_position = 30  # Vertical position at the top
-        x_offset = x_start  # Tracks current X position
+    def _render_formula(self):
+        """
+        Lays out the formula tokens left to right onto an off-screen surface
+        filled with the background color.
+        """
+        tokens = []  # (surface, x) pairs
+        x_offset = 0  # Tracks current X position
 
         for c_idx, clause in enumerate(self.formula):
             if c_idx > 0:
                 # ✅ Draw AND `∧` between clauses
-                and_surface = font.render("AND", True, (0, 0, 0))
-                self.screen.blit(and_surface, (x_offset, y_position))
+                and_surface = self._get_text("AND", (0, 0, 0))
+                tokens.append((and_surface, x_offset))
                 x_offset += and_surface.get_width() + 15  # Spacing after `∧`
 
             # ✅ Add opening bracket `(`
-            bracket_surface = font.render("(", True, (0, 0, 0))
-            self.screen.blit(bracket_surface, (x_offset, y_position))
+            bracket_surface = self._get_text("(", (0, 0, 0))
+            tokens.append((bracket_surface, x_offset))
             x_offset += bracket_surface.get_width() + 5  # Spacing after `(`
 
             for i, (var, neg, clause_id) in enumerate(clause):  # ✅ Unpack correctly
@@ -425,22 +562,28 @@ class ThreeSatGraphVisualizer:
                 color = (255, 0, 0) if (c_idx, i) in self.highlighted_literals else (0, 0, 0)
 
                 # ✅ Render the literal text with highlighting
-                text_surface = font.render(literal_text, True, color)
-                self.screen.blit(text_surface, (x_offset, y_position))
+                text_surface = self._get_text(literal_text, color)
+                tokens.append((text_surface, x_offset))
                 x_offset += text_surface.get_width() + 10  # Move X position forward
 
                 if i < len(clause) - 1:
                     # ✅ Draw OR `∨` operator
                     or_color = (255, 0, 0) if c_idx in self.highlighted_operators else (0, 0, 0)
-                    or_surface = font.render("OR", True, or_color)
-                    self.screen.blit(or_surface, (x_offset, y_position))
+                    or_surface = self._get_text("OR", or_color)
+                    tokens.append((or_surface, x_offset))
                     x_offset += or_surface.get_width() + 10  # Spacing after `∨`
 
             # ✅ Add closing bracket `)`
-            bracket_surface = font.render(")", True, (0, 0, 0))
-            self.screen.blit(bracket_surface, (x_offset, y_position))
+            bracket_surface = self._get_text(")", (0, 0, 0))
+            tokens.append((bracket_surface, x_offset))
             x_offset += bracket_surface.get_width() + 15 
 
+        height = max((token.get_height() for token, _ in tokens), default=0)
+        surface = pygame.Surface((max(x_offset, 1), max(height, 1))).convert(self.screen)
+        surface.fill(BACKGROUND_COLOR)
+        surface.blits([(token, (x, 0)) for token, x in tokens], False)
+        return surface
+
     def show_mapping(self, sat_assignment):
         self.run()
         """
@@ -453,7 +596,7 @@ class ThreeSatGraphVisualizer:
             sat_assignment: Dictionary mapping variables to their truth values (0/1).
         """
         # Convert SAT assignment to an Independent Set
-        independent_set = self.reduction.sol1tosol2(sat_assignment)
+        independent_set = self.reduction.solution1_to_solution2(sat_assignment)
 
         # Replace variables in the formula with their assigned values
         formula_with_values = []
@@ -477,7 +620,7 @@ class ThreeSatGraphVisualizer:
 
         # Highlight the nodes in the graph
         self.highlighted_nodes = independent_set
-        independent_literals = self.reduction.sol1tosol2(sat_assignment)
+        independent_literals = self.reduction.solution1_to_solution2(sat_assignment)
         # Refresh the visualization to display the updated formula and highlighted nodes
         self._update_highlighted_literals(independent_literals)
 
@@ -501,54 +644,98 @@ class ThreeSatGraphVisualizer:
         self.screen.fill(BACKGROUND_COLOR)  # Clear screen
 
         # ✅ Draw updated formula at the top
-        font = pygame.font.SysFont(None, 32, bold=False)
-        text_surface = font.render(formula_text, True, (0, 0, 0))  # Black text
+        text_surface = self._formula_font.render(formula_text, True, (0, 0, 0))  # Black text
         self.screen.blit(text_surface, (50, 30))  # Draw formula at the top
 
         # ✅ Draw edges (unaffected)
-        for u, v in self.graph.edges():
+        for u, v in self._edges:
             pygame.draw.line(self.screen, EDGE_COLOR, self.pos[u], self.pos[v], 2)
 
         # ✅ Draw nodes with highlighting if in independent_set
-        for node in self.graph.nodes():
+        for node in self._nodes:
             node_color = HIGHLIGHT_NODE_COLOR if node in self.highlighted_nodes else NODE_COLOR
             pygame.draw.circle(self.screen, node_color, self.pos[node], RADIUS)
 
             # Draw text inside node
-            font = pygame.font.SysFont(None, 24)
             text_label = str(node)
-            text_surface = font.render(text_label, True, (0, 0, 0))
+            text_surface = self._get_text(text_label, (0, 0, 0), self._node_font)
             text_rect = text_surface.get_rect(center=self.pos[node])
             self.screen.blit(text_surface, text_rect)
 
         # ✅ Refresh screen
         pygame.display.flip()
 
-def draw_curved_edge(screen, start, end, control, color):
+def bezier_points(start, control, end, segments=20):
     """
-    Draws a quadratic Bezier curve between two points using a control point.
+    Samples a quadratic Bezier curve at segments + 1 evenly spaced values of t.
     """
     points = []
-    for t in range(0, 21):  # Generate 20 points along the curve
-        t /= 20.0
+    for t in range(0, segments + 1):
+        t /= segments
         x = (1 - t) ** 2 * start[0] + 2 * (1 - t) * t * control[0] + t ** 2 * end[0]
         y = (1 - t) ** 2 * start[1] + 2 * (1 - t) * t * control[1] + t ** 2 * end[1]
-        points.append((int(x), int(y)))
+        points.append((x, y))
+    return points
 
-    pygame.draw.lines(screen, color, False, points, 2)  # Draw curved line
 
-
-def is_edge_passing_through(start, end, node_pos):
+def bezier_distance_sq(start, control, end, point):
     """
-    Checks if an edge between (start, end) passes near node_pos.
+    Exact squared distance from `point` to a quadratic Bezier curve.
+
+    Writing B(t) - point = m + 2ta + t^2 b, the closest t is either an endpoint
+    or a root in (0, 1) of the cubic d/dt |B(t) - point|^2 = 0.
     """
-    x1, y1 = start
-    x2, y2 = end
-    x, y = node_pos
+    ax, ay = control[0] - start[0], control[1] - start[1]
+    bx, by = end[0] - control[0] - ax, end[1] - control[1] - ay
+    mx, my = start[0] - point[0], start[1] - point[1]
 
-    # Compute the perpendicular distance from node to line
-    distance = abs((y2 - y1) * x - (x2 - x1) * y + x2 * y1 - y2 * x1) / math.sqrt((y2 - y1) ** 2 + (x2 - x1) ** 2)
+    candidates = [0.0, 1.0]
+    for t in real_cubic_roots(bx * bx + by * by,
+                              3 * (ax * bx + ay * by),
+                              2 * (ax * ax + ay * ay) + mx * bx + my * by,
+                              mx * ax + my * ay):
+        if 0 < t < 1:
+            candidates.append(t)
 
-    return distance < 30  # Adjust threshold as needed
+    best = float('inf')
+    for t in candidates:
+        dx = mx + 2 * t * ax + t * t * bx
+        dy = my + 2 * t * ay + t * t * by
+        best = min(best, dx * dx + dy * dy)
+    return best
 
 
+def _cbrt(x):
+    """Real cube root, sign preserved (math.cbrt needs Python 3.11)."""
+    return math.copysign(abs(x) ** (1 / 3), x)
+
+
+def real_cubic_roots(a, b, c, d, eps=1e-12):
+    """
+    Real roots of a*t^3 + b*t^2 + c*t + d (Cardano / trigonometric form),
+    falling back to the quadratic or linear case when leading terms vanish.
+    """
+    if abs(a) < eps:
+        if abs(b) < eps:
+            return [-d / c] if abs(c) >= eps else []
+        disc = c * c - 4 * b * d
+        if disc < 0:
+            return []
+        root = math.sqrt(disc)
+        return [(-c + root) / (2 * b), (-c - root) / (2 * b)]
+
+    # Depressed cubic s^3 + p*s + q with t = s - b / 3
+    b, c, d = b / a, c / a, d / a
+    shift = b / 3
+    p = c - b * b / 3
+    q = 2 * b ** 3 / 27 - b * c / 3 + d
+    disc = (q / 2) ** 2 + (p / 3) ** 3
+    if disc > 0:
+        root = math.sqrt(disc)
+        return [_cbrt(-q / 2 + root) + _cbrt(-q / 2 - root) - shift]
+    if p == 0:
+        return [-shift]
+    # Three real roots
+    r = 2 * math.sqrt(-p / 3)
+    phi = math.acos(max(-1.0, min(1.0, 3 * q / (p * r))))
+    return [r * math.cos((phi - 2 * math.pi * k) / 3) - shift for k in range(3)]
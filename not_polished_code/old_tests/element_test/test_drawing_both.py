@@ -1,5 +1,6 @@
 import pygame
 import numpy as np
+from itertools import combinations
 from npvis.element import Graph, Formula, Edge, Node
 
 # Initialize Pygame
@@ -13,25 +14,13 @@ formula_bb = np.array([[20,  50], [380, 750]])  # left pane
 graph_bb   = np.array([[420, 50], [1180, 750]])  # right pane
 
 # Initialize graph with nodes, edges, and groups
-nodes = set()
 node_count = 9
-node_list = []
-for i in range(node_count):
-    node = Node(id=i, name=f"{i}")
-    nodes.add(node)
-    node_list.append(node)
-
-edges = set()
-groups = []
-group_size = 3
+nodes = [Node(id=i, name=f"{i}") for i in range(node_count)]
 
-for i in range(0, node_count, group_size):
-    group = node_list[i:i + group_size]
-    if len(group) == group_size:
-        groups.append(group)
-        for a in range(group_size):
-            for b in range(a + 1, group_size):
-                edges.add(Edge(group[a], group[b]))
+group_size = 3
+groups = [nodes[i:i + group_size]
+          for i in range(0, node_count - group_size + 1, group_size)]
+edges = [Edge(a, b) for group in groups for a, b in combinations(group, 2)]
 
 # Create graph and determine node positions
 graph = Graph(nodes=nodes, edges=edges, groups=groups, bounding_box=graph_bb, node_radius=20)
@@ -1,37 +1,25 @@
 import pygame
 import numpy as np
 import math
+from itertools import combinations
 
 from npvis.element import Node, Edge, Graph
 
 # Test code for graph display
 if __name__ == "__main__":
     # Initialize a graph with nodes, edges, and groups
-    nodes = set()
     center = np.array([300, 300])
     radius = 150
     node_count = 39
 
     # Create nodes
-    for i in range(node_count):
-        node = Node(id=i, name=f"{i}")
-        nodes.add(node)
-
-    # Create edges to form 3-membered fully connected groups
-    edges = set()
-    node_list = list(nodes)
+    nodes = [Node(id=i, name=f"{i}") for i in range(node_count)]
 
     # Group nodes into 3-membered clusters and connect each group fully
-    groups = []
     group_size = 3
-    for i in range(0, node_count, group_size):
-        group = node_list[i:i + group_size]
-        if len(group) == group_size:
-            groups.append(group)
-            # Fully connect the three nodes in the group
-            for a in range(group_size):
-                for b in range(a + 1, group_size):
-                    edges.add(Edge(group[a], group[b]))
+    groups = [nodes[i:i + group_size]
+              for i in range(0, node_count - group_size + 1, group_size)]
+    edges = [Edge(a, b) for group in groups for a, b in combinations(group, 2)]
 
     # Initialize and display the graph with bounding box and node radius
     bounding_box = np.array([[0, 0], [600, 600]])
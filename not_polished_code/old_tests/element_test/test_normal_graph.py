@@ -1,5 +1,4 @@
 import pygame
-import random
 import numpy as np
 
 from npvis.element import Node, Edge, Graph
@@ -7,7 +6,7 @@ from npvis.element import Node, Edge, Graph
 # Test code for arbitrary graph display
 if __name__ == "__main__":
     # Initialize a graph with nodes, edges, and groups
-    nodes = set()
+    nodes = []
     center = np.array([300, 300])
     radius = 150
     node_count = 12
@@ -15,18 +14,16 @@ if __name__ == "__main__":
     # Create nodes
     for i in range(node_count):
         node = Node(id=i, name=f"X{i}")
-        nodes.add(node)
+        nodes.append(node)
 
-    edges = set()
-    node_list = list(nodes)
     groups = []
 
-    # randomly generate edges (around half of all possible edges)
-    for i in range(0, node_count):
-        for j in range(i + 1, node_count):
-            n = random.random()
-            if n > 0.5:
-                edges.add(Edge(node_list[i], node_list[j]))
+    # randomly generate edges (around half of all possible edges):
+    # draw the whole matrix at once and keep the upper triangle (i < j)
+    rng = np.random.default_rng()
+    mask = np.triu(rng.random((node_count, node_count)) > 0.5, k=1)
+    i_idx, j_idx = np.nonzero(mask)
+    edges = [Edge(nodes[i], nodes[j]) for i, j in zip(i_idx.tolist(), j_idx.tolist())]
 
     # Initialize and display the graph with bounding box and node radius
     graph = Graph(nodes=nodes, edges=edges, groups=groups, node_radius=20)
@@ -1,100 +1,31 @@
+from itertools import combinations
+
 from npvis.element.element import Formula, Graph, Node, Edge
 from npvis.reduction import Reduction
 from npvis.problem.independent_set import IndependentSetProblem
 from npvis.problem.three_sat import ThreeSATProblem
 
+# Legacy copy used by the old demos in this folder.  The maintained
+# implementation is npvis.reduction.ThreeSatToIndependentSetReduction; this
+# one follows its method names (solution1_to_solution2 / solution2_to_solution1)
+# and literal attribute (is_negated).
 class ThreeSatToIndependentSetReduction(Reduction):
-    def __init__(self, three_sat_problem: ThreeSATProblem, ind_set_problem: IndependentSetProblem):
+    def __init__(self, three_sat_problem: ThreeSATProblem, ind_set_problem: IndependentSetProblem, debug: bool = False):
         super().__init__(three_sat_problem, ind_set_problem)
+        self.DEBUG = debug  # gates the prints that sort the whole independent set
         self.input1_to_input2_pairs = [] 
-        self.output1_to_output2_pairs = []
-        self.output2_to_output1_pairs = []
+        self.output1_to_output2_pairs = []  # (literal, node) pairs, only filled when tracking
+        self.output2_to_output1_pairs = []  # (node, literal) pairs, only filled when tracking
+        self._track_output_pairs = False  # nothing reads these yet; set True to record them
         self.formula = three_sat_problem.get_formula()
+        self._formula_list = self.formula.get_as_list()  # formula is fixed; fetch once
+        # variable name -> its first literal in formula order, for filling in unassigned vars
+        self._name_to_first_literal = {}
+        for clause in self._formula_list:
+            for literal in clause:
+                self._name_to_first_literal.setdefault(literal.name, literal)
         self.graph, self.clause_vertices, self.literal_to_formula_indices, self.input1_to_input2_pairs, self.literal_id_to_node_id = self.build_3sat_graph_from_formula()
         
-    # def __init__(self, formula: Formula):
-    #     """
-    #     Initializes the reduction with a given 3-SAT formula.
-        
-    #     Args:
-    #         formula: List of clauses, where each clause is a list of literals.
-    #                  Example: [[(1, False), (2, True), (3, False)], ...]
-    #     """
-    #     self.formula = formula
-    #     # literal id to node id = input to input pair
-    #     self.graph, self.clause_vertices, self.literal_to_formula_indices, self.input1_to_input2_pairs, self.literal_id_to_node_id = self.build_3sat_graph_from_formula()
-    #     self.output1_to_output2 = {} 
-    #     self.output2_to_output1 = {}
-        
-    
-    def add_edges_for_clause(self, G, nodes):
-        """Ensure the clause forms a triangle (3 literals) or a single edge (2 literals)."""
-        if len(nodes) == 3:
-            G.add_edge(Edge(nodes[0], nodes[1]))
-            G.add_edge(Edge(nodes[1], nodes[2]))
-            G.add_edge(Edge(nodes[2], nodes[0]))
-        elif len(nodes) == 2:
-            G.add_edge(Edge(nodes[0], nodes[1]))
-        
-    # def build_3sat_graph_from_formula(self):
-    #     """
-    #     Constructs a 3-SAT graph using custom Graph, Node, and Edge classes.
-
-    #     Returns:
-    #         G: Custom Graph object.
-    #         clause_vertices: List of lists mapping clause indices to their corresponding node IDs.
-    #         literal_to_formula_indices: A mapping of literals to positions in the formula.
-    #         self.input1_to_input2_pairs: Mapping from (literal, clause_idx) → node_id for faster lookups.
-    #     """
-    #     G = Graph()
-    #     clause_vertices = []
-    #     self.input1_to_input2_pairs = {}
-    #     literal_to_formula_indices = {}
-    #     literal_id_to_node_id = {}
-    #     node_id = 1  # Node index counter
-
-    #     formula_list = self.formula.get_as_list() 
-        
-    #     for c_idx, clause in enumerate(formula_list):
-    #         c_nodes = []
-
-    #         for lit_idx, literal in enumerate(clause):
-    #             print (literal)
-    #             print(lit_idx)
-    #             node = Node(node_id, str(literal))  # Create a new Node
-    #             G.add_node(node)
-    #             c_nodes.append(node)
-
-    #             # Store mappings
-    #             self.input1_to_input2_pairs[(literal, c_idx)] = node  # Maps (literal, clause index) to Node object
-    #             literal_to_formula_indices.setdefault(literal, []).append((c_idx, lit_idx))
-    #             print(f"Literal ID: {literal.id} → Node ID: {node_id}")
-    #             literal_id_to_node_id[literal.id] = node_id  # Store only literal_id -> node_id mapping
-
-    #             node_id += 1  # Increment node ID
-
-    #         # Add edges within the clause
-    #         self.add_edges_for_clause(G, c_nodes)
-
-    #         clause_vertices.append(c_nodes)
-
-    #     # Add edges between complementary literals (x and ¬x) across clauses
-    #     num_clauses = len(formula_list)
-
-    #     for c_idx in range(num_clauses - 1):  # Check neighboring clauses
-    #         current_clause = formula_list[c_idx]
-    #         next_clause = formula_list[c_idx + 1]
-
-    #         for literal in current_clause:
-    #             opposite_literal = (literal.name, not literal.is_not_negated)  # Flip negation
-    #             if opposite_literal in next_clause:
-    #                 node1 = self.input1_to_input2_pairs.get((literal, c_idx))
-    #                 node2 = self.input1_to_input2_pairs.get((opposite_literal, c_idx + 1))
-    #                 if node1 and node2:
-    #                     G.add_edge(Edge(node1, node2))
-
-    #     return G, clause_vertices, literal_to_formula_indices, self.input1_to_input2_pairs, literal_id_to_node_id
-    
     # TODO: inherit from Reduction class
     # construct this: self.input1_to_input2_pairs = [] (ref to ref?)
     def build_3sat_graph_from_formula(self): 
@@ -115,16 +46,16 @@ class ThreeSatToIndependentSetReduction(Reduction):
         literal_id_to_node_id = {}
         node_id = 1  # Node index counter
 
-        formula_list = self.formula.get_as_list()
+        formula_list = self._formula_list
 
         # Step 1: Create Nodes and Groups
         for c_idx, clause in enumerate(formula_list):
-            c_nodes = []
+            c_nodes = [None] * len(clause)
 
             for lit_idx, literal in enumerate(clause):
                 node = Node(node_id, str(literal))  # Create Node with unique ID and name
                 G.add_node(node) # i want a pass by reference mapping to map each litreral to a node object
-                c_nodes.append(node)
+                c_nodes[lit_idx] = node
 
                 # Store mappings 
                 # self.input1_to_input2_pairs[(literal, c_idx)] = node
@@ -140,30 +71,28 @@ class ThreeSatToIndependentSetReduction(Reduction):
             G.groups.append(c_nodes)
 
             # Step 2: Add edges between nodes within the clause (fully connected)
-            for i in range(len(c_nodes)):
-                for j in range(i + 1, len(c_nodes)):
-                    G.add_edge(Edge(c_nodes[i], c_nodes[j]))
+            for node_a, node_b in combinations(c_nodes, 2):
+                G.add_edge(Edge(node_a, node_b))
 
         # Step 3: Add edges between complementary literals (x and ¬x) across clauses
         for c_idx in range(len(formula_list) - 1):
-            for literal in formula_list[c_idx]:
-                opposite_literal = next(
-                    (lit for lit in formula_list[c_idx + 1] if lit.name == literal.name and lit.is_not_negated != literal.is_not_negated),
+            for lit_idx, literal in enumerate(formula_list[c_idx]):
+                opposite_idx = next(
+                    (k for k, lit in enumerate(formula_list[c_idx + 1]) if lit.name == literal.name and lit.is_negated != literal.is_negated),
                     None
                 )
-                if opposite_literal:
+                if opposite_idx is not None:
                     # node1 = self.input1_to_input2_pairs.get((literal, c_idx))
                     # node2 = self.input1_to_input2_pairs.get((opposite_literal, c_idx + 1))
-                    node1 = self.input1_to_input2_pairs[literal]
-                    node2 = self.input1_to_input2_pairs[opposite_literal]
+                    # nodes were created in clause order, so index straight into clause_vertices
+                    node1 = clause_vertices[c_idx][lit_idx]
+                    node2 = clause_vertices[c_idx + 1][opposite_idx]
                     if node1 and node2:
                         G.add_edge(Edge(node1, node2))
 
         return G, clause_vertices, literal_to_formula_indices, self.input1_to_input2_pairs, literal_id_to_node_id
 
-    # def sol1tosol2(self, sat_assignment):
-    
-    def sol1tosol2(self, sat_assignment):
+    def solution1_to_solution2(self, sat_assignment):
         """
         Convert a satisfying assignment of 3-SAT into an Independent Set solution.
 
@@ -177,32 +106,35 @@ class ThreeSatToIndependentSetReduction(Reduction):
         independent_set = set()
 
         # Ensure we get the structured formula list
-        formula_list = self.formula.get_as_list()
+        formula_list = self._formula_list
 
         print(f"SAT Assignment: {sat_assignment}\n")
 
         for c_idx, clause in enumerate(formula_list):  # Use the correct formula list
-            for literal in clause:
+            clause_nodes = self.clause_vertices[c_idx]  # built alongside the graph, same order as clause
+            for lit_idx, literal in enumerate(clause):
                 var = literal.name
-                is_not_negated = literal.is_not_negated
+                is_not_negated = not literal.is_negated
                 clause_id = literal.clause_id
                 id = literal.id  # (i, False) → ¬x_i, (i, True) → x_i
 
                 # Check if the assignment satisfies the literal
                 if (sat_assignment[var] == 1 and is_not_negated) or (sat_assignment[var] == 0 and not is_not_negated):
                     # node = self.input1_to_input2_pairs.get((literal, c_idx))  # Correct lookup
-                    node = self.input1_to_input2_pairs[literal]
+                    node = clause_nodes[lit_idx]
                     if node:
                         independent_set.add(node.id)
-                        self.output1_to_output2_pairs[literal] = node
+                        if self._track_output_pairs:
+                            self.output1_to_output2_pairs.append((literal, node))
                         print(f"  Node {node.id} (Literal {literal} in Clause {c_idx}) added to Independent Set")
 
-        print(f"\nIndependent Set Solution: {sorted(independent_set)}\n")
+        if self.DEBUG:
+            print(f"\nIndependent Set Solution: {sorted(independent_set)}\n")
         print("Conversion to Independent Set completed!\n")
         
         return independent_set
 
-    def sol2tosol1(self, independent_set):
+    def solution2_to_solution1(self, independent_set):
         """
         Convert an Independent Set solution back into a satisfying assignment for 3-SAT.
 
@@ -216,46 +148,37 @@ class ThreeSatToIndependentSetReduction(Reduction):
         sat_assignment = {}
 
         # Fetch structured formula list
-        formula_list = self.formula.get_as_list()  # ✅ Fixing the access to formula
+        formula_list = self._formula_list  # ✅ Fixing the access to formula
 
-        print(f"Independent Set Input (sorted): {sorted(independent_set)}\n")
+        if self.DEBUG:
+            print(f"Independent Set Input (sorted): {sorted(independent_set)}\n")
 
         # Assign values based on selected nodes in the independent set
         for literal, node in self.input1_to_input2_pairs.items():
             clause_idx = literal.clause_id
             if node.id in independent_set:
                 var = literal.name
-                is_not_negated = literal.is_not_negated
+                is_not_negated = not literal.is_negated
                 clause_id = literal.clause_id
                 id = literal.id  # (i, False) → ¬x_i, (i, True) → x_i
 
                 sat_assignment[var] = is_not_negated  # 1 = 1, not 0 = 1
 
-                self.output2_to_output1_pairs[node] = literal  # Reverse mapping
+                if self._track_output_pairs:
+                    self.output2_to_output1_pairs.append((node, literal))  # Reverse mapping
 
                 print(f"  Node {node.id} corresponds to Literal {literal} in Clause {clause_idx}")
                 print(f"    Assigning Variable x{var} -> {sat_assignment[var]}\n")
 
         # Ensure all variables in the formula are assigned a value
         # all_vars = {var for clause in formula_list for var, _ in clause}  # ✅ Fix: Using correct formula structure
-        all_vars = {literal.name for clause in formula_list for literal in clause}
+        name_to_first_literal = self._name_to_first_literal
 
-        for var in sorted(all_vars):
+        for var in sorted(name_to_first_literal):
             if var not in sat_assignment:
-                for clause in formula_list:  # ✅ Fix: Iterate over structured formula list
-                    for literal in clause:
-                        
-                        lit_var = literal.name
-                        is_not_negated = literal.is_not_negated
-                        clause_id = literal.clause_id
-                        id = literal.id  # (i, False) → ¬x_i, (i, True) → x_i
-
-                        if lit_var == var:
-                            sat_assignment[var] = not is_not_negated  # Assign based on literal negation
-                            print(f"  Variable x{var} missing from independent set. Found literal {literal}. Assigning x{var} -> {sat_assignment[var]}\n")
-                            break
-                    if var in sat_assignment:
-                        break  # Stop searching once assigned
+                literal = name_to_first_literal[var]  # first occurrence, as the old clause scan found
+                sat_assignment[var] = literal.is_negated  # Assign based on literal negation
+                print(f"  Variable x{var} missing from independent set. Found literal {literal}. Assigning x{var} -> {sat_assignment[var]}\n")
 
         print(f"Recovered SAT Assignment: {sat_assignment}\n")
         print("Conversion to SAT Assignment completed!\n")
@@ -263,6 +186,10 @@ class ThreeSatToIndependentSetReduction(Reduction):
         return sat_assignment
 
 
+    # Old names, kept for the demo scripts that still call them.
+    sol1tosol2 = solution1_to_solution2
+    sol2tosol1 = solution2_to_solution1
+
     def is_independent_set(self, node_set):
         """
         Checks if the given set of node_ids forms an independent set.
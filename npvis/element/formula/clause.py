@@ -3,6 +3,8 @@ from npvis.element.subelement import SubElement
 from npvis.element.color import LIGHTGREY, LIGHTPINK
 
 class Clause(SubElement):
+    __slots__ = ('variables', 'clause_id')
+
     def __init__(self, clause_id: int):
         SubElement.__init__(self, clause_id, clause_id, LIGHTGREY)
         self.variables = []
@@ -28,10 +30,12 @@ class Clause(SubElement):
         self.color = self.default_color
 
     def evaluate(self, solution):
-        if any(solution[v.name] != v.is_negated for v in self.variables):
-            self.highlight_color = (150, 255, 150)
-            return True
-        self.highlight_color = (255, 150, 150)
-        return False
+        return self.mark_evaluated(
+            any(bool(solution[v.name]) != v.is_negated for v in self.variables))
+
+    def mark_evaluated(self, satisfied):
+        """Pick the solution-display color for an evaluation result."""
+        self.highlight_color = (150, 255, 150) if satisfied else (255, 150, 150)
+        return satisfied
         # return any(solution[v.name] != v.is_negated for v in self.variables)
     
\ No newline at end of file
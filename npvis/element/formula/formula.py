@@ -14,6 +14,7 @@ class Formula(Element):
         self.font = None
         self.literal_rects = {}  # (clause_idx, lit_idx) -> Rect
         self.clause_rects  = {}  # clause_idx -> Rect
+        self._text_cache = {}    # (text, color) -> rendered Surface
 
     def set_bounding_box(self, bounding_box):
         margin = 20
@@ -101,6 +102,20 @@ class Formula(Element):
     def evaluate(self, solution):
         return all(clause.evaluate(solution) for clause in self.clauses)
 
+    def _render_text(self, text, color):
+        """
+        Font rendering is the slowest part of a frame, and the formula text
+        rarely changes, so each (text, color) is rendered only once.
+        """
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def display(self, screen):
         if self.font is None:
             self.font = pygame.font.Font(None, 30)
@@ -119,28 +134,28 @@ class Formula(Element):
             run_x = clause_x
 
             # Render "("
-            open_surf = self.font.render("(", True, LIGHTGREY)
+            open_surf = self._render_text("(", LIGHTGREY)
             open_rect = open_surf.get_rect(topleft=(run_x, current_y))
             screen.blit(open_surf, open_rect)
             run_x += open_rect.width
 
             # Render each literal + " OR "
             for l_idx, var in enumerate(clause.variables):
-                lit_surf = self.font.render(str(var), True, var.color)
+                lit_surf = self._render_text(str(var), var.color)
                 lit_rect = lit_surf.get_rect(topleft=(run_x, current_y))
                 screen.blit(lit_surf, lit_rect)
                 self.literal_rects[(c_idx, l_idx)] = lit_rect
                 run_x += lit_rect.width
 
                 if l_idx < len(clause.variables) - 1:
-                    or_surf = self.font.render(" OR ", True, LIGHTGREY)
+                    or_surf = self._render_text(" OR ", LIGHTGREY)
                     or_rect = or_surf.get_rect(topleft=(run_x, current_y))
                     screen.blit(or_surf, or_rect)
                     run_x += or_rect.width
 
             # Render ") AND " or ")"
             closing = ") AND " if c_idx < len(self.clauses) - 1 else ")"
-            close_surf = self.font.render(closing, True, LIGHTGREY)
+            close_surf = self._render_text(closing, LIGHTGREY)
             close_rect = close_surf.get_rect(topleft=(run_x, current_y))
             screen.blit(close_surf, close_rect)
             run_x += close_rect.width
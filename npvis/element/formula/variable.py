@@ -3,6 +3,8 @@ from npvis.element.subelement import SubElement
 
 
 class Variable(SubElement):
+    __slots__ = ('is_negated', 'clause_id')
+
     def __init__(self, name, is_negated, clause_id, var_id, color=LIGHTBLUE):
         SubElement.__init__(self, var_id, name, color, LIGHTPINK)
         self.is_negated = is_negated
@@ -3,6 +3,8 @@ from npvis.element.subelement import SubElement
 
 
 class Edge(SubElement):
+    __slots__ = ('node1', 'node2')
+
     def __init__(self, node1, node2, color=LIGHTGREY, id=0):
         super().__init__(id, node1.name + node2.name, color)
         self.node1 = node1
@@ -11,8 +11,8 @@ from npvis.element.graph.graph_drawing_utils import (
     has_overlapping_edge,
     draw_bezier_curve,
     draw_thick_bezier_curve,
+    thick_bezier_polylines,
     find_best_control_point,
-    is_inside_circle
 )
 from npvis.element.color import LIGHTGREY
 from path import DATA_DIR
@@ -26,13 +26,15 @@ class Graph(Element):
     and lays out each cell’s nodes in a neat circle.
     """
     def __init__(self,
-                 nodes=set(),
-                 edges=set(),
+                 nodes=(),
+                 edges=(),
                  groups=None,
                  bounding_box=np.array([[50,50],[550,550]]),
                  node_radius=20):
-        self.nodes = set(nodes)
-        self.edges = set(edges)
+        # lists, not sets: iteration (drawing, layout) follows insertion
+        # order and stays stable from frame to frame
+        self.nodes = list(nodes)
+        self.edges = list(edges)
         self.groups = list(groups) if groups is not None else []
         self.original_bounding_box = np.array(bounding_box, dtype=float)
         self.node_radius = node_radius
@@ -49,20 +51,39 @@ class Graph(Element):
         self._create_node_dictionary()
         self.next_node_id = 0
 
+        # rendering caches: the label font is created on first display(),
+        # and each (name, color) pair is drawn into a surface only once
+        self._label_font = None
+        self._node_surface_cache = {}
+
+        # (N, 2) array of node centers for hit-testing, in _node_order order;
+        # refreshed whenever positions are determined
+        self._node_order = []
+        self._node_positions = None
+
+        # edge -> (curve polylines or None, start, end) in screen pixels;
+        # depends only on node positions, so it is filled in alongside them
+        self._edge_geometry = {}
+
     def _create_node_dictionary(self):
         self.node_dict = {node.id: node for node in self.nodes}
 
     # def add_node(self, node: Node):
-    #     self.nodes.add(node)
+    #     self.nodes.append(node)
     #     self._create_node_dictionary()
 
+    def _has_node(self, node):
+        # dictionary lookup rather than a linear scan of self.nodes
+        return node is not None and self.node_dict.get(node.id) is node
+
     def add_node(self, name=None) -> Node:
         assert name is None or isinstance(name, str), "Name must be a string."
         assert len(name) <= 10, "Name must be at most 10 characters long."
 
         node_name = name if name else str(self.next_node_id)
         node = Node(self.next_node_id, node_name)
-        self.nodes.add(node)
+        self.nodes.append(node)
+        self.node_dict[node.id] = node
         self.next_node_id += 1
         return node
 
@@ -73,15 +94,33 @@ class Graph(Element):
         assert node1 != None, "Node 1 is None."
         assert node2 != None, "Node 2 is None."
         assert node1 != node2, "Cannot add an edge between the same node."
-        assert node1 in self.nodes, "Node 1 is not in the graph."
-        assert node2 in self.nodes, "Node 2 is not in the graph."
+        assert self._has_node(node1), "Node 1 is not in the graph."
+        assert self._has_node(node2), "Node 2 is not in the graph."
 
         edge = Edge(node1, node2)
-        self.edges.add(edge)
+        self.edges.append(edge)
 
         node1.add_neighbor(node2.id)
         node2.add_neighbor(node1.id)
 
+    def add_edges_from(self, node_pairs) -> None:
+        """
+        Adds an edge for every (node1, node2) pair in one call, like
+        networkx's add_edges_from.  The edge set is updated once at the end.
+        """
+        has_node = self._has_node
+        new_edges = []
+        for node1, node2 in node_pairs:
+            assert node1 is not None and node2 is not None, "Node is None."
+            assert node1 != node2, "Cannot add an edge between the same node."
+            assert has_node(node1) and has_node(node2), "Node is not in the graph."
+
+            new_edges.append(Edge(node1, node2))
+            node1.neighbors.append(node2.id)
+            node2.neighbors.append(node1.id)
+
+        self.edges.extend(new_edges)
+
     def add_group(self, nodes) -> None:
         """
         Adds a group of nodes to the graph.
@@ -89,7 +128,7 @@ class Graph(Element):
         assert len(nodes) > 0, "Group must contain at least one node."
         assert len(set(nodes)) == len(nodes), "Group contains duplicate nodes."
         for node in nodes:
-            assert node in self.nodes, "Node is not in the graph."
+            assert self._has_node(node), "Node is not in the graph."
 
         self.groups.append(nodes)
 
@@ -118,6 +157,48 @@ class Graph(Element):
             self._determine_node_positions_grouped()
         else:
             self._determine_node_positions_nx()
+        self._cache_node_positions()
+
+    def _cache_node_positions(self):
+        self._node_order = list(self.nodes)
+        self._node_positions = np.array(
+            [n.location for n in self._node_order], dtype=np.float32).reshape(-1, 2)
+        self._cache_edge_geometry()
+
+    def _cache_edge_geometry(self):
+        """
+        Decide once per layout which edges must curve around a node, and
+        the pixels to draw them with, instead of re-testing every edge
+        against every node and re-sampling its curve on each frame.
+        """
+        P = self._node_positions
+        index = {n: i for i, n in enumerate(self._node_order)}
+        threshold2 = (self.node_radius * 1.5) ** 2
+        self._edge_geometry = {}
+        for e in self.edges:
+            a = e.node1.location
+            b = e.node2.location
+            # same test as has_overlapping_edge, against all nodes at once:
+            # project every center onto the segment a->b
+            line = b - a
+            length2 = float(line @ line)
+            curved = False
+            if length2 > 0:
+                t = ((P - a) @ line) / length2
+                d2 = ((a + t[:, None] * line - P) ** 2).sum(axis=1)
+                near = (t >= 0) & (t <= 1) & (d2 < threshold2)
+                near[index[e.node1]] = near[index[e.node2]] = False
+                curved = bool(near.any())
+            self._edge_geometry[e] = self._edge_shape(e, curved)
+
+    def _edge_shape(self, edge, curved):
+        a = edge.node1.location
+        b = edge.node2.location
+        polylines = None
+        if curved:
+            cp = find_best_control_point(a, b, self.nodes, self.node_radius)
+            polylines = thick_bezier_polylines(a, cp, b, width=3)
+        return polylines, tuple(a.astype(int)), tuple(b.astype(int))
 
     def _determine_node_positions_grouped(self):
         """
@@ -164,11 +245,11 @@ class Graph(Element):
             if radius > max_radius:
                 radius = max_radius
 
-            N = len(group)
-            for i,node in enumerate(group):
-                angle = 2*math.pi * i / N
-                offset = np.array([math.cos(angle), math.sin(angle)]) * radius
-                node.location = center + offset
+            # every member's angle at once, then one write per node
+            angles = 2*np.pi * np.arange(len(group)) / len(group)
+            points = center + radius * np.column_stack((np.cos(angles), np.sin(angles)))
+            for node, point in zip(group, points):
+                node.location[:] = point
 
     def _determine_node_positions_nx(self):
         """
@@ -190,29 +271,39 @@ class Graph(Element):
 
         for n in self.nodes:
             px,py = pos[n.id]
-            n.location = np.array([center[0] + px*scale_x,
-                                   center[1] + py*scale_y])
+            n.location[0] = center[0] + px*scale_x
+            n.location[1] = center[1] + py*scale_y
 
     def display(self, screen):
         # edges
-        for e in self.edges:
-            a = e.node1.location
-            b = e.node2.location
-            if has_overlapping_edge(e, self.nodes, self.node_radius):
-                cp = find_best_control_point(a,b,self.nodes,self.node_radius)
-                draw_thick_bezier_curve(screen, a, cp, b, e.color, width=3)
-            else:
-                pygame.draw.line(screen, e.color, a.astype(int), b.astype(int), 3)
-
-        # nodes
+        geometry = self._edge_geometry
+        draw_lines = pygame.draw.lines
+        # lock once for the whole run of line primitives instead of once per
+        # call; must be released before the node blits below
+        screen.lock()
+        try:
+            for e in self.edges:
+                shape = geometry.get(e)
+                if shape is None:  # added after the last layout
+                    shape = self._edge_shape(
+                        e, has_overlapping_edge(e, self.nodes, self.node_radius))
+                polylines, a, b = shape
+                if polylines is not None:
+                    for points in polylines:
+                        draw_lines(screen, e.color, False, points, 2)
+                else:
+                    pygame.draw.line(screen, e.color, a, b, 3)
+        finally:
+            screen.unlock()
+
+        # nodes: one pre-rendered surface per node, drawn in a single blits()
+        blit_list = []
         for n in self.nodes:
-            pygame.draw.circle(screen, n.color,
-                               n.location.astype(int),
-                               self.node_radius)
-            font = pygame.font.SysFont(None, 24)
-            surf = font.render(str(n.name), True, (255,255,255))
-            rect = surf.get_rect(center=n.location.astype(int))
-            screen.blit(surf, rect)
+            surf = self._get_node_surface(n)
+            x, y = n.location.astype(int)
+            w, h = surf.get_size()
+            blit_list.append((surf, (x - w // 2, y - h // 2)))
+        screen.blits(blit_list, doreturn=False)
 
         # debug: outer bbox
         x0,y0 = self.original_bounding_box[0]
@@ -221,13 +312,40 @@ class Graph(Element):
                          pygame.Rect(x0, y0, x1-x0, y1-y0),
                          width=1)
 
+    def _get_node_surface(self, node):
+        """
+        Return the circle + label image for a node, rendering it on first use.
+        Keyed by (name, color), so a color change picks a different entry.
+        """
+        key = (node.name, node.color)
+        surf = self._node_surface_cache.get(key)
+        if surf is None:
+            if self._label_font is None:
+                self._label_font = pygame.font.SysFont(None, 24)
+            label = self._label_font.render(str(node.name), True, (255,255,255))
+
+            # big enough for the circle and for labels wider than it
+            r = self.node_radius
+            w = max(2 * r + 1, label.get_width())
+            h = max(2 * r + 1, label.get_height())
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.circle(surf, node.color, (w // 2, h // 2), r)
+            surf.blit(label, label.get_rect(center=(w // 2, h // 2)))
+
+            self._node_surface_cache[key] = surf
+        return surf
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = np.array(event.pos)
-            for n in self.nodes:
-                if is_inside_circle(pos, n.location, self.node_radius):
-                    print(f"Clicked node {n.id} ({n.name})")
-                    return n
+            if self._node_positions is None or len(self._node_order) != len(self.nodes):
+                self._cache_node_positions()
+            # test every node at once: squared distance to each center
+            d2 = ((self._node_positions - np.array(event.pos)) ** 2).sum(axis=1)
+            hits = np.flatnonzero(d2 <= self.node_radius ** 2)
+            if hits.size:
+                n = self._node_order[hits[0]]
+                print(f"Clicked node {n.id} ({n.name})")
+                return n
         return None
 
     '''
@@ -238,8 +356,8 @@ class Graph(Element):
         if not filepath.exists():
             raise FileNotFoundError(f"File {filename} not found in {DATA_DIR}")
 
-        self.nodes = set()  # Ensure fresh
-        self.edges = set()
+        self.nodes = []  # Ensure fresh
+        self.edges = []
         self.groups = []
 
         with open(filepath, "r") as file:
@@ -12,16 +12,10 @@ def draw_bezier_curve(screen, start, control, end, color):
         end: End position.
         color: RGB color tuple.
     """
-    num_segments = 30  # Controls smoothness of the curve
-    points = []
-
-    for t in np.linspace(0, 1, num_segments):
-        # Quadratic Bézier interpolation
-        point = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
-        points.append(point.astype(int))
+    points = bezier_points(start, control, end)
 
     # Use Pygame's default line thickness (same as pygame.draw.line)
-    pygame.draw.aalines(screen, color, False, points)
+    pygame.draw.aalines(screen, color, False, points.tolist())
 
 def draw_thick_bezier_curve(screen, start, control, end, color, width=2):
     """
@@ -35,18 +29,36 @@ def draw_thick_bezier_curve(screen, start, control, end, color, width=2):
         color: RGB color tuple.
         width: Line thickness.
     """
-    num_segments = 30  # Controls smoothness of the curve
-    points = []
+    for offset_points in thick_bezier_polylines(start, control, end, width):
+        pygame.draw.lines(screen, color, False, offset_points, 2)
 
-    for t in np.linspace(0, 1, num_segments):
-        # Quadratic Bézier interpolation
-        point = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
-        points.append(point.astype(int))
+def bezier_points(start, control, end, num_segments=30):
+    """
+    Samples a quadratic Bézier curve start → control → end.
 
-    # Draw curve using multiple slightly offset lines to simulate thickness
-    for i in range(-width // 2, width // 2 + 1):
-        offset_points = [(p[0] + i, p[1] + i) for p in points]
-        pygame.draw.lines(screen, color, False, offset_points, 2)
+    Args:
+        start: Start position (numpy array).
+        control: Control point for the Bézier curve.
+        end: End position.
+        num_segments: Number of sample points; controls smoothness.
+
+    Returns:
+        (num_segments, 2) int array of points along the curve.
+    """
+    t = np.linspace(0, 1, num_segments)[:, None]
+    points = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
+    return points.astype(int)
+
+def thick_bezier_polylines(start, control, end, width=2):
+    """
+    Point lists drawn by draw_thick_bezier_curve: the curve shifted
+    diagonally once per pixel of thickness.
+
+    Returns:
+        list of point lists, each ready for pygame.draw.lines.
+    """
+    points = bezier_points(start, control, end)
+    return [(points + i).tolist() for i in range(-width // 2, width // 2 + 1)]
 
 def find_best_control_point(start_pos, end_pos, nodes, node_radius):
     """
@@ -91,7 +103,10 @@ def is_point_too_close(point, node_location, min_distance):
     Returns:
         bool: True if the point is too close, False otherwise.
     """
-    return np.linalg.norm(point - node_location) < min_distance
+    # compare squared distances: no temporary array, no sqrt
+    dx = float(point[0]) - float(node_location[0])
+    dy = float(point[1]) - float(node_location[1])
+    return dx * dx + dy * dy < min_distance * min_distance
 
 def has_overlapping_edge(edge, nodes, node_radius):
     """
@@ -145,11 +160,14 @@ def is_point_near_line(point, line_start, line_end, threshold):
     if np.dot(projected_point - line_start, projected_point - line_end) > 0:
         return False  # The projected point is outside the segment
 
-    # Calculate distance from node to the closest point on the edge
-    distance = np.linalg.norm(point - projected_point)
-    return distance < threshold
+    # Calculate (squared) distance from node to the closest point on the edge
+    dx = float(point[0]) - float(projected_point[0])
+    dy = float(point[1]) - float(projected_point[1])
+    return dx * dx + dy * dy < threshold * threshold
 
 
 # Function to detect if a point is inside a circle
 def is_inside_circle(point, circle_center, radius):
-    return np.linalg.norm(point - circle_center) <= radius
\ No newline at end of file
+    dx = float(point[0]) - float(circle_center[0])
+    dy = float(point[1]) - float(circle_center[1])
+    return dx * dx + dy * dy <= radius * radius
\ No newline at end of file
@@ -4,11 +4,14 @@ from npvis.element.subelement import SubElement
 
 
 class Node(SubElement):
-    neighbors = []  # store all neighbor node_id
+    __slots__ = ('location', 'neighbors')
 
-    def __init__(self, id, name, color=LIGHTBLUE, location=np.array([0, 0])):
+    def __init__(self, id, name, color=LIGHTBLUE, location=None):
         super().__init__(id, name, color, LIGHTPINK)
-        self.location = location
+        # each node owns a packed float32 (x, y); layouts write into it in place
+        self.location = (np.zeros(2, dtype=np.float32) if location is None
+                         else np.array(location, dtype=np.float32))
+        self.neighbors = []  # store all neighbor node_id
 
     def change_color(self, new_color):
         self.color = new_color
@@ -2,6 +2,10 @@
 from npvis.element.color import LIGHTBLUE, LIGHTPINK
 
 class SubElement:
+    # sub-elements are created per literal / node / edge and used as dict
+    # keys by the reductions; slots keep them small, with no __dict__
+    __slots__ = ('id', 'name', 'color', 'default_color', 'highlight_color', 'selected')
+
     def __init__(self, id, name, default_color=LIGHTBLUE, highlight_color=LIGHTPINK, selected=False):
         self.id = id
         self.name = name
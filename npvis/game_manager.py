@@ -1,17 +1,32 @@
 import pygame
 
+# the only events GameManager.handle_event reacts to; everything else
+# (mouse motion, key releases, ...) is dropped by SDL before it is queued
+HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+]
+
 class GameManager:
-    def __init__(self, width=800, height=600, fps=30):
+    def __init__(self, width=800, height=600, fps=30, idle_fps=2):
         pygame.init()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("NP Problem Display")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         self.fps = fps
+        self.idle_fps = idle_fps  # wake-up rate while nothing needs redrawing
         self.problems = []  # List of tuples: (problem_instance, bounding_box)
         self.running = False
         self.show_solution = False  # Flag to toggle solution display
         self.clicked = set() # List of clicked sub-elements 
         self.reduction = None
+        self.dirty = True  # redraw needed; static scenes are only drawn when something changes
 
     def add_problem(self, problem, bounding_box):
         """
@@ -32,41 +47,51 @@ class GameManager:
             graph.determine_node_positions()
 
         self.problems.append((problem, bounding_box))
+        self.dirty = True
 
     def add_reduction(self, reduction):
         self.reduction = reduction
+        self.dirty = True
 
     def clear_screen(self, color=(255, 255, 255)):
         self.screen.fill(color)
 
     def process_events(self):
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s:
-                    # Toggle solution display when 's' is pressed
-                    self.show_solution = not self.show_solution
-                    if not self.show_solution:
-                        for problem, _ in self.problems:
-                            problem.disable_solution()
-                        if self.reduction is not None:
-                            self.reduction.display_input_to_input(self.clicked)
+            self.handle_event(event)
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                for problem, bounding_box in self.problems:
-                    # Check if the mouse click is within the problem's bounding box
-                    if (bounding_box[0, 0] < event.pos[0] < bounding_box[1, 0] and 
-                        bounding_box[0, 1] < event.pos[1] < bounding_box[1, 1]):
-                        clicked_element = problem.handle_event(event)
-                        if clicked_element is not None:
-                            if clicked_element in self.clicked:
-                                # unclick it 
-                                self.clicked.remove(clicked_element)
-                            else:
-                                self.clicked.add(clicked_element)
-                            if not self.show_solution:
-                                self.reduction.display_input_to_input(self.clicked)
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            # window contents may have been lost
+            self.dirty = True
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_s:
+                self.dirty = True
+                # Toggle solution display when 's' is pressed
+                self.show_solution = not self.show_solution
+                if not self.show_solution:
+                    for problem, _ in self.problems:
+                        problem.disable_solution()
+                    if self.reduction is not None:
+                        self.reduction.display_input_to_input(self.clicked)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            for problem, bounding_box in self.problems:
+                # Check if the mouse click is within the problem's bounding box
+                if (bounding_box[0, 0] < event.pos[0] < bounding_box[1, 0] and 
+                    bounding_box[0, 1] < event.pos[1] < bounding_box[1, 1]):
+                    clicked_element = problem.handle_event(event)
+                    if clicked_element is not None:
+                        self.dirty = True
+                        if clicked_element in self.clicked:
+                            # unclick it 
+                            self.clicked.remove(clicked_element)
+                        else:
+                            self.clicked.add(clicked_element)
+                        if not self.show_solution:
+                            self.reduction.display_input_to_input(self.clicked)
 
     def update_display(self):
         for problem, _ in self.problems:
@@ -78,9 +103,17 @@ class GameManager:
     def run(self):
         self.running = True
         while self.running:
-            self.clear_screen()
+            if not self.dirty:
+                # Nothing to draw: sleep until an event arrives, waking at
+                # idle_fps at most, instead of spinning at the full frame rate.
+                event = pygame.event.wait(int(1000 / self.idle_fps))
+                if event.type != pygame.NOEVENT:
+                    self.handle_event(event)
             self.process_events()
-            self.update_display()
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+            if self.dirty:
+                self.clear_screen()
+                self.update_display()
+                pygame.display.flip()
+                self.dirty = False
+                self.clock.tick(self.fps)
         pygame.quit()
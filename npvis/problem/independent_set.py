@@ -22,12 +22,11 @@ class IndependentSetProblem(NPProblem):
             bool: True if no two nodes in the set have an edge, else False.
         """
         node_ids = set(node_ids)
-        for node1_id in node_ids:
-            for node2_id in node_ids:
-                if node1_id != node2_id and self.element.hasEdge(
-                    self.element.get_node_by_id(node1_id), self.element.get_node_by_id(node2_id)
-                ):
-                    return False
+        # One pass over the edges: an edge with both endpoints chosen breaks
+        # independence.  Compares ids only, so nodes are never hashed.
+        for edge in self.element.edges:
+            if edge.node1.id in node_ids and edge.node2.id in node_ids:
+                return False
         return True
 
     def get_graph(self) -> Graph:
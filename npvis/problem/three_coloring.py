@@ -41,7 +41,7 @@ class ThreeColoringProblem(NPProblem):
         # sanity checks, if you like:
         assert len(nodes) > 0, "Group must contain at least one node"
         for n in nodes:
-            assert n in self.element.nodes, f"{n} not in graph"
+            assert self.element.get_node_by_id(n.id) is n, f"{n} not in graph"
         self.element.groups.append(nodes)
 
     def reset_coloring(self):
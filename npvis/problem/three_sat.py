@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from npvis.element import Formula, Variable, Clause
 from npvis.problem.np_problem import NPProblem
 
@@ -10,6 +11,11 @@ class ThreeSATProblem(NPProblem):
 
     def __init__(self):
         super().__init__(Formula())
+        # (variable names, clause variable indices, clause negations), built
+        # on the first evaluate() for the current formula; _compiled_for holds
+        # the (element, clause list, clause count) it was built from
+        self._compiled = None
+        self._compiled_for = None
         
     
     def load_formula_from_tuples(self, list_of_clause_tuples):
@@ -18,6 +24,24 @@ class ThreeSATProblem(NPProblem):
     def load_formula_from_file(self, filename: str):
         self.element.parse(filename)
 
+    def _compile(self):
+        """
+        Lays the formula out as two (clauses, width) arrays: the dense index
+        of each literal's variable and its negation flag.  Returns False when
+        clauses differ in width, which the array layout cannot hold.
+        """
+        clauses = self.element.clauses
+        widths = {len(clause.variables) for clause in clauses}
+        if len(widths) != 1 or 0 in widths:
+            return False
+        names = {}  # variable name -> dense index, in order of appearance
+        var_idx = [[names.setdefault(v.name, len(names)) for v in clause.variables]
+                   for clause in clauses]
+        negs = [[v.is_negated for v in clause.variables] for clause in clauses]
+        return (list(names),
+                np.array(var_idx, dtype=np.int32),
+                np.array(negs, dtype=np.bool_))
+
     def evaluate(self, assignment) -> bool:
         """
         Evaluates this 3-SAT formula given a variable assignment.
@@ -28,6 +52,26 @@ class ThreeSATProblem(NPProblem):
         Returns:
             bool: True if formula is satisfied, otherwise False.
         """
+        # Rebuild when the formula was swapped, reloaded or grown, however
+        # that happened (loads replace the clause list, additions extend it)
+        clauses = self.element.clauses
+        key = self._compiled_for
+        if key is None or key[0] is not self.element or key[1] is not clauses or key[2] != len(clauses):
+            self._compiled = self._compile()
+            self._compiled_for = (self.element, clauses, len(clauses))
+        if self._compiled:
+            names, var_idx, negs = self._compiled
+            try:
+                vals = np.fromiter((bool(assignment[name]) for name in names),
+                                   dtype=np.bool_, count=len(names))
+            except KeyError:
+                vals = None  # partial assignment: let the clause loop decide
+            if vals is not None:
+                # a clause holds when some literal's value differs from its negation flag
+                clause_sat = (vals[var_idx] ^ negs).any(axis=1)
+                for clause, satisfied in zip(self.element.clauses, clause_sat.tolist()):
+                    clause.mark_evaluated(satisfied)
+                return bool(clause_sat.all())
         return all(clause.evaluate(assignment) for clause in self.element.clauses)
 
     def get_variables(self) -> set[str]:
@@ -1,10 +1,12 @@
 from npvis.element.color import lighten_rgb
 class Reduction:
+    __slots__ = ('problem1', 'problem2', 'input1_to_input2_dict', '_i2_to_i1', 'highlighted')
 
     def __init__(self, problem1, problem2):
         self.problem1 = problem1
         self.problem2 = problem2
         self.input1_to_input2_dict = {}  # map input 1 to set of input 2
+        self._i2_to_i1 = {}  # reverse index: input 2 to the input 1s mapped to it
         self.highlighted = []  # keep track of highlighted items for resetting
 
     '''
@@ -33,20 +35,56 @@ class Reduction:
     '''
 
     def add_input1_to_input2_by_pair(self, input1, input2):
-        if input1 in self.input1_to_input2_dict:
-            self.input1_to_input2_dict[input1].add(input2)
+        mapped = self.input1_to_input2_dict.get(input1)
+        if mapped is not None:
+            mapped.add(input2)
         else:
             self.input1_to_input2_dict[input1] = {input2}
+        self._index_input2s(input1, (input2,))
 
     '''
     method to populate input_to_input by connecting one set of input2 to 1
     '''
 
     def add_input1_to_input2_by_set(self, input1, input2set):
-        if input1 in self.input1_to_input2_dict:
-            self.input1_to_input2_dict[input1].update(input2set)
+        mapped = self.input1_to_input2_dict.get(input1)
+        if mapped is not None:
+            mapped.update(input2set)
         else:
             self.input1_to_input2_dict[input1] = input2set.copy()
+        self._index_input2s(input1, input2set)
+
+    '''
+    method to populate input_to_input from a stream of (input1, input2) pairs,
+    grouping them by input1 first so each key is merged only once
+    '''
+
+    def add_input1_to_input2_bulk(self, pairs):
+        grouped = {}
+        for input1, input2 in pairs:
+            group = grouped.get(input1)
+            if group is not None:
+                group.add(input2)
+            else:
+                grouped[input1] = {input2}
+
+        input1_to_input2 = self.input1_to_input2_dict
+        for input1, input2set in grouped.items():
+            mapped = input1_to_input2.get(input1)
+            if mapped is not None:
+                mapped.update(input2set)
+            else:
+                input1_to_input2[input1] = input2set
+            self._index_input2s(input1, input2set)
+
+    def _index_input2s(self, input1, input2s):
+        i2_to_i1 = self._i2_to_i1
+        for input2 in input2s:
+            owners = i2_to_i1.get(input2)
+            if owners is not None:
+                owners.add(input1)
+            else:
+                i2_to_i1[input2] = {input1}
 
     '''
     method to change color according to the clicked set
@@ -66,24 +104,33 @@ class Reduction:
         if len(clicked_set) == 1:
             # if The user click on problem 1 element 
             e1 = next(iter(clicked_set))
-            if e1 in self.input1_to_input2_dict:
+            mapped = self.input1_to_input2_dict.get(e1)
+            if mapped is not None:
                 is_input1 = True
-                for e in self.input1_to_input2_dict[e1]:
+                for e in mapped:
                     e.change_color((255, 0, 0))
                     self.highlighted.append(e)
         # CASE: not input 1
         if not is_input1:
-            for key, value in self.input1_to_input2_dict.items():
-                # print(f"clicked set: {clicked_set}")
-                # print(f"input 1 set: {value}")
-                if clicked_set <= value: # clicked set is a subset 
-                    # print("find input 1")
-                    
-                    # Note: empirically, a steeper ratio seems help visualization
-                    ratio = (1 - len(clicked_set) / len(value)) ** 3
-                    lighter_color = lighten_rgb((255, 0, 0), ratio)
-                    key.change_color(lighter_color)
-                    self.highlighted.append(key)
+            # the input 1s whose set contains the whole clicked set are the
+            # ones mapped to every clicked element: intersect their owners
+            # via the reverse index instead of scanning every mapping
+            i2_to_i1 = self._i2_to_i1
+            keys = None
+            for e in clicked_set:
+                owners = i2_to_i1.get(e)
+                if not owners:
+                    return
+                keys = set(owners) if keys is None else keys & owners
+                if not keys:
+                    return
+            for key in keys:
+                value = self.input1_to_input2_dict[key]
+                # Note: empirically, a steeper ratio seems help visualization
+                ratio = (1 - len(clicked_set) / len(value)) ** 3
+                lighter_color = lighten_rgb((255, 0, 0), ratio)
+                key.change_color(lighter_color)
+                self.highlighted.append(key)
 
     def reset_highlighted(self):
         for e in self.highlighted:
@@ -37,6 +37,8 @@ class ThreeSatToThreeColoringReduction(Reduction):
         self.clause_outputs = []
 
     def _debug(self, *args):
+        # Callers that format an f-string or build a list check self.DEBUG
+        # first, so nothing is formatted when tracing is off.
         if self.DEBUG:
             print("[3SAT→3COL]", *args)
 
@@ -64,8 +66,7 @@ class ThreeSatToThreeColoringReduction(Reduction):
         '''
         col = self.problem2.element
         B = col.add_node("Base"); T = col.add_node("True"); F = col.add_node("False")
-        for u,v in ((B,T),(T,F),(F,B)):
-            col.add_edge(u,v)
+        col.add_edges_from(((B,T),(T,F),(F,B)))
         col.add_group([B,T,F])
         self.base_node,self.true_node,self.false_node = B,T,F
         self._debug("Base triangle:", B.id, T.id, F.id)
@@ -87,17 +88,19 @@ class ThreeSatToThreeColoringReduction(Reduction):
             for clause in self.problem1.element.clauses
             for v in clause.variables
         })
+        # every gadget edge is collected here and added in one call below
+        edges = []
         for name in names:
             # Add positive and negative nodes for the variable
             p = col.add_node(f"{name}")
             n = col.add_node(f"¬{name}")
 
             # Connect pos and neg nodes => they are different colors
-            col.add_edge(p,n)
+            edges.append((p,n))
 
             # Connect both nodes to the base triangle => they are not base color
-            col.add_edge(p,self.base_node)
-            col.add_edge(n,self.base_node)
+            edges.append((p,self.base_node))
+            edges.append((n,self.base_node))
             # Thus, they are either true or false.
 
             # Group the variable gadget nodes together for display
@@ -105,7 +108,9 @@ class ThreeSatToThreeColoringReduction(Reduction):
 
             # Store the variable nodes in the class instance
             self.var_nodes[name] = (p,n)
-            self._debug(f"Var gadget {name}:", p.id, n.id)
+            if self.DEBUG:
+                self._debug(f"Var gadget {name}:", p.id, n.id)
+        col.add_edges_from(edges)
 
         '''
         Here, this is also for display...
@@ -113,14 +118,16 @@ class ThreeSatToThreeColoringReduction(Reduction):
         'add_input1_to_input2_by_pair' ensures that clicking the variable 
         will highlight the created positive and negative variable nodes.
         '''
+        map_pairs = []
         for ci, clause in enumerate(self.problem1.element.clauses):
             for lit in clause.variables:
                 # We retrieve the positive and negative nodes for the variable
                 p, n = self.var_nodes[lit.name]
+                map_pairs.append((lit, p))
+                map_pairs.append((lit, n))
 
-                # Add input-to-input mapping for display (this method comes from the base reduction class)
-                self.add_input1_to_input2_by_pair(lit, p)
-                self.add_input1_to_input2_by_pair(lit, n)
+        # Add input-to-input mapping for display (this method comes from the base reduction class)
+        self.add_input1_to_input2_bulk(map_pairs)
 
     def _build_clause_gadgets(self):
         '''
@@ -133,8 +140,12 @@ class ThreeSatToThreeColoringReduction(Reduction):
           enforce the clause to be satisfied if at least one literal is true.
         See below comments for details.
         '''
-        col = self.problem2
+        col = self.problem2.element
         self.clause_outputs = []
+        # edges of every OR gadget, added to the graph in one call at the end,
+        # and the clause → gadget-node display pairs, flushed the same way
+        edges = []
+        map_pairs = []
 
         # We iterate over each clause in the 3-SAT problem
         for ci, clause in enumerate(self.problem1.element.clauses):
@@ -160,7 +171,7 @@ class ThreeSatToThreeColoringReduction(Reduction):
                 - g2_12: second internal node of the OR gadget
                 - out12: output node of the OR gadget
             '''
-            g1_12, g2_12, out12 = self._build_or_gadget(lnodes[0], lnodes[1])
+            g1_12, g2_12, out12 = self._build_or_gadget(lnodes[0], lnodes[1], edges)
 
             '''
             Similarly, we connect the output of the first OR gadget to the third literal's node.
@@ -174,7 +185,7 @@ class ThreeSatToThreeColoringReduction(Reduction):
                 - g2_123: second internal node of the second OR gadget
                 - out123: output node of the second OR gadget
             '''
-            g1_123, g2_123, out123 = self._build_or_gadget(out12, lnodes[2])
+            g1_123, g2_123, out123 = self._build_or_gadget(out12, lnodes[2], edges)
 
             '''
             Now we connect the output of the second OR gadget to the base triangle and the false node.
@@ -182,8 +193,8 @@ class ThreeSatToThreeColoringReduction(Reduction):
             The specific logic / proof of why this work is not there in the code,
             but you can check this file: 3-coloring-or-gadget.png in the documentation_images/reduction folder.
             '''
-            col.add_edge(out123, self.base_node)
-            col.add_edge(out123, self.false_node)
+            edges.append((out123, self.base_node))
+            edges.append((out123, self.false_node))
 
             # record all 6 nodes
             self.clause_outputs.append(
@@ -195,14 +206,18 @@ class ThreeSatToThreeColoringReduction(Reduction):
             This is also for display...
             If the user clicks on the entire clause, we want to highlight these created OR gadgets
             '''
-            for or_node in (g1_12, g2_12, out12, g1_123, g2_123, out123):
-                self.add_input1_to_input2_by_pair(clause, or_node)
+            map_pairs.extend((clause, or_node)
+                             for or_node in (g1_12, g2_12, out12, g1_123, g2_123, out123))
+
+            if self.DEBUG:
+                self._debug(f"Clause#{ci} gadgets:",
+                            [g1_12.id, g2_12.id, out12.id,
+                             g1_123.id, g2_123.id, out123.id])
 
-            self._debug(f"Clause#{ci} gadgets:",
-                        [g1_12.id, g2_12.id, out12.id,
-                         g1_123.id, g2_123.id, out123.id])
+        col.add_edges_from(edges)
+        self.add_input1_to_input2_bulk(map_pairs)
 
-    def _build_or_gadget(self, a: Node, b: Node):
+    def _build_or_gadget(self, a: Node, b: Node, edges: list):
         '''
         ⭐ Construct a 3-node OR gadget in the 3-coloring reduction graph.
 
@@ -224,6 +239,9 @@ class ThreeSatToThreeColoringReduction(Reduction):
           g1: internal node connected to `a`.
           g2: internal node connected to `b`.
           out: output node of the OR gadget.
+
+        The five edges are appended to `edges` rather than added right away,
+        so the caller can insert all clause gadgets' edges at once.
         '''
         col = self.problem2.element
         g1  = col.add_node("in1")
@@ -231,13 +249,13 @@ class ThreeSatToThreeColoringReduction(Reduction):
         out = col.add_node("out")
 
         # connect the two inputs to the internal nodes
-        col.add_edge(g1, a)
-        col.add_edge(g2, b)
+        edges.append((g1, a))
+        edges.append((g2, b))
 
         # fully interconnect the trio
-        col.add_edge(g1, g2)
-        col.add_edge(g2, out)
-        col.add_edge(out, g1)
+        edges.append((g1, g2))
+        edges.append((g2, out))
+        edges.append((out, g1))
 
         # group the OR gadget nodes together for display
         col.add_group([out,g2,g1])
@@ -13,6 +13,10 @@
 #
 # --------------------------------------------------
 
+from itertools import combinations
+
+import numpy as np
+
 from npvis.reduction.reduction import Reduction
 from npvis.problem.independent_set import IndependentSetProblem
 from npvis.problem.three_sat import ThreeSATProblem
@@ -35,6 +39,12 @@ class ThreeSatToIndependentSetReduction(Reduction):
     highlight how solutions correspond.
     """
 
+    # Fixed attribute layout: no per‑instance __dict__, and attribute reads
+    # in the hot loops are plain slot lookups.
+    __slots__ = ('literals', 'lit_to_node', '_clauses_flat',
+                 '_all_var_names_sorted', '_clause_var_idx', '_clause_negs',
+                 'DEBUG')
+
     # ---------------------------------------------------------------------
     # Construction 
     # ---------------------------------------------------------------------
@@ -56,18 +66,48 @@ class ThreeSatToIndependentSetReduction(Reduction):
         """
         super().__init__(three_sat_problem, ind_set_problem)
 
-        self.input1_to_input2_pairs = {}  # SAT‑literal  → graph‑node
+        # Parallel lists indexed by literal‑occurrence id (0 … 3m‑1):
+        #     self.literals[k]     → k‑th literal occurrence in the formula
+        #     self.lit_to_node[k]  → the graph node created for it
+        self.literals    = []
+        self.lit_to_node = []
+
+        # Per clause, the (name, is_negated, node) triple of every literal,
+        # with is_negated stored as an int 0/1; filled by input1_to_input2()
+        # and scanned by solution1_to_solution2().
+        self._clauses_flat = []
+
+        # Sorted names of every variable in ϕ; the formula never changes
+        # after construction so input1_to_input2() computes this once.
+        # None until then, so the converters can tell the graph is missing.
+        self._all_var_names_sorted = None
+
+        # Dense (m, k) arrays of variable index / is_negated per literal,
+        # used by the vectorised path of solution1_to_solution2().  Left as
+        # None when clauses have different widths.
+        self._clause_var_idx = None
+        self._clause_negs    = None
 
         # Whether debug printing is enabled.
         self.DEBUG = debug
 
     # ---------------------------------------------------------------------
     # Utility printing helper
+    #
+    # Call sites that build an f-string wrap it in ``if self.DEBUG:`` so the
+    # message is never formatted when tracing is off.
     # ---------------------------------------------------------------------
     def _debug_print(self, msg: str):
         if self.DEBUG:
             print("[DEBUG]", msg)
 
+    def _require_graph(self):
+        """Raise a clear error if input1_to_input2() has not run yet."""
+        if self._all_var_names_sorted is None:
+            raise RuntimeError(
+                "The graph has not been built yet; call input1_to_input2() "
+                "before converting solutions.")
+
     # ---------------------------------------------------------------------
     # 1.  Build the target graph G from the 3‑SAT formula ϕ
     # ---------------------------------------------------------------------
@@ -79,46 +119,93 @@ class ThreeSatToIndependentSetReduction(Reduction):
         # -- Grab the list of (clause, literals) objects -------------------
         self._debug_print("Starting input1_to_input2…")
         formula_list = self.problem1.element.clauses
-        self._debug_print(f"Retrieved formula_list with {len(formula_list)} clause(s).")
+        if self.DEBUG:
+            self._debug_print(f"Retrieved formula_list with {len(formula_list)} clause(s).")
+
+        # Nodes of every literal occurrence, bucketed by variable name and
+        # polarity:   pos_buckets['x'] → [nodes for x],  neg_buckets['x'] → [nodes for ¬x]
+        pos_buckets = {}
+        neg_buckets = {}
+        self._clauses_flat = []
+        self.literals    = []
+        self.lit_to_node = []
+
+        # Every edge (clique and complementary) is collected here and handed
+        # to the graph in a single add_edges_from() call at the end; the
+        # literal/clause → node display pairs are flushed the same way.
+        edges_out = []
+        map_pairs = []
+
+        # Bound methods used once per literal, resolved once up front.
+        add_node        = self.problem2.element.add_node
+        append_pair     = map_pairs.append
+        append_literal  = self.literals.append
+        append_lit_node = self.lit_to_node.append
+        append_edge     = edges_out.append
+        extend_edges    = edges_out.extend
 
         # Iterate over each clause *Cⱼ* and perform steps (node creation &
         # intra‑clause clique).
         for c_idx, clause in enumerate(formula_list, start=1):
-            self._debug_print(f"Processing Clause #{c_idx} with {len(clause.variables)} variable(s).")
+            if self.DEBUG:
+                self._debug_print(f"Processing Clause #{c_idx} with {len(clause.variables)} variable(s).")
 
-            clause_nodes = []   # Nodes we create for this clause
+            # Sized up front (3 for 3‑CNF) and filled by index.
+            clause_vars  = clause.variables
+            width        = len(clause_vars)
+            clause_nodes = [None] * width   # Nodes we create for this clause
+            clause_flat  = [None] * width   # (name, is_negated, node) per literal
 
             # ---- 1(a) Node creation ------------------------------------
-            for literal in clause.variables:
+            for k, literal in enumerate(clause_vars):
+                name, neg = literal.name, literal.is_negated   # read once per literal
+
                 # Create a *brand new* node in the target graph whose name is
                 # the repr() of the literal (e.g. 'x₁', '¬x₂').
-                node = self.problem2.element.add_node(repr(literal))
+                node = add_node(repr(literal))
 
                 # Store bidirectional mapping for future conversions / UI.
-                self.input1_to_input2_pairs[literal] = node
-                self.add_input1_to_input2_by_pair(literal, node)    # clicking the literal will highlight the node
-                self.add_input1_to_input2_by_pair(clause, node)     # clicking the clause will highlight the node
+                append_literal(literal)
+                append_lit_node(node)
+                append_pair((literal, node))    # clicking the literal will highlight the node
+                append_pair((clause, node))     # clicking the clause will highlight the node
 
                 # Trace what we just did
-                self._debug_print(f"  -- Added literal/node pair [{literal} : {node}] to maps")
-                self._debug_print(f"  Created node '{node.id}' with label '{node.name}' for literal {literal}.")
+                if self.DEBUG:
+                    self._debug_print(f"  -- Added literal/node pair [{literal} : {node}] to maps")
+                    self._debug_print(f"  Created node '{node.id}' with label '{node.name}' for literal {literal}.")
+
+                clause_nodes[k] = node
+                (neg_buckets if neg else pos_buckets).setdefault(name, []).append(node)
+                clause_flat[k]  = (name, int(neg), node)
+
+            # ---- 1(b) Intra‑clause **clique** ---------------------------
+            # Connect every pair inside the clause so that only **one** can
+            # be chosen in an independent set.  For 3‑CNF this is a triangle;
+            # combinations() generates the pairs in C, in the same clause pass.
+            extend_edges(combinations(clause_nodes, 2))
 
-                # Remember the node so we can fully‑connect them momentarily.
-                clause_nodes.append(node)
+            self._clauses_flat.append(clause_flat)
 
-            # ---- 1(b) Tag nodes that belong to the same clause ----------
+            # ---- 1(c) Tag nodes that belong to the same clause ----------
             # The visualiser will later display them as a unit (triangle).
             self.problem2.element.add_group(clause_nodes)
-            self._debug_print(f"  Added group for Clause #{c_idx}: node IDs {[n.id for n in clause_nodes]}.")
-
-            # ---- 1(c) Intra‑clause **clique** --------------------------
-            # Connect every pair inside the clause so that only **one** can
-            # be chosen in an independent set.  Because each clause contains
-            # exactly 3 literals (3‑CNF) we always create a triangle.
-            for i in range(len(clause_nodes)):
-                for j in range(i + 1, len(clause_nodes)):
-                    self.problem2.element.add_edge(clause_nodes[i], clause_nodes[j])
-            self._debug_print(f"  Fully connected the nodes within Clause #{c_idx}.")
+            if self.DEBUG:
+                self._debug_print(f"  Added group for Clause #{c_idx}: node IDs {[n.id for n in clause_nodes]}.")
+
+        self._all_var_names_sorted = sorted(pos_buckets.keys() | neg_buckets.keys())
+
+        if len({len(cf) for cf in self._clauses_flat}) == 1 and self.literals:
+            var_index = {name: i for i, name in enumerate(self._all_var_names_sorted)}
+            self._clause_var_idx = np.array(
+                [[var_index[name] for name, _, _ in cf] for cf in self._clauses_flat],
+                dtype=np.int32)
+            self._clause_negs = np.array(
+                [[neg for _, neg, _ in cf] for cf in self._clauses_flat],
+                dtype=np.bool_)
+        else:
+            self._clause_var_idx = None
+            self._clause_negs    = None
 
         # -----------------------------------------------------------------
         # 2.  Inter‑clause edges between *complementary* literals
@@ -139,65 +226,51 @@ class ThreeSatToIndependentSetReduction(Reduction):
         # -----------------------------------------------------------------
         self._debug_print("Connecting complementary literal occurrences across clauses…")
 
-        # Because we need to cross‑compare every literal against *later* ones
-        # input1_to_input2_pairs :  { literal_obj → node_obj }
-        items = list(self.input1_to_input2_pairs.items())
-        #               └───┬───┘
-        #           each item is  (literal, node)
-
-        # These helper dicts collect **all** positive / negative occurrences
-        # so the GUI can colour or highlight them together later.
-        name_literal_dict = {}  # 'x' → {literal objects for x},  'x_neg' → {¬x, …}
-        name_node_dict    = {}  # 'x' → {node objects   for x},  'x_neg' → {v₃, …}
-
-        for i in range(len(items)):
-            literal_A, node_A = items[i]
-
-            # Normalise the key so occurrences fall into exactly two buckets:
-            #     'x'      → positive literal  x
-            #     'x_neg'  → negative literal ¬x
-            name = literal_A.name if not literal_A.is_negated else f"{literal_A.name}_neg"
-
-            # Record this literal / node under its bucket for later use
-            # name_literal_dict.setdefault(name, set()).add(literal_A)
-            name_node_dict.setdefault(name, set()).add(node_A)
-
-            # Compare with every *later* literal_B (j > i) so each pair is handled once
-            for j in range(i + 1, len(items)):
-                literal_B, node_B = items[j]
-
-                # SAME variable label   &&   OPPOSITE polarity?  → connect!
-                
-                # Example   ─ Complementary literals  →  condition is **True**
-                # -------------------------------------------------------------
-                # literal_A =  x2    (name='x2', is_negated=False)
-                # literal_B = ¬x2    (name='x2', is_negated=True)
-                #
-                # literal_A.name == literal_B.name        →  'x2' == 'x2'       ✔︎
-                # literal_A.is_negated != literal_B.is_negated  →  False != True ✔︎
-                # Both tests pass, so we add an edge between the two nodes.
-                if literal_A.name == literal_B.name and literal_A.is_negated != literal_B.is_negated:
-                    self.problem2.element.add_edge(node_A, node_B)
-                    self._debug_print(
-                        f"  Connected complementary literals '{literal_A}' ↔ '{literal_B}' "
-                        f"via nodes {node_A.id} and {node_B.id}.")
-                    
-        # # The gathered *same‑sign* buckets are now inserted into helper maps
-        # # so the visualiser can flash *all* positive occurrences of x together.
-        # for name, literals in name_literal_dict.items():
-        #     # (Framework call omitted – uncomment if the UI expects it)
-        #     self._debug_print(
-        #         f"  -- Added same_name_literals/same_name_nodes pair "
-        #         f"[{literals} : {name_node_dict[name]}] to maps")
+        # Only a positive and a negative occurrence of the *same* variable
+        # can be complementary, so instead of comparing every pair of
+        # literals we join the two buckets of each variable:
+        #
+        #   pos_buckets['x2'] = [v₀, v₆]      (x2 in clauses 1 and 3)
+        #   neg_buckets['x2'] = [v₃]          (¬x2 in clause 2)
+        #   edges             = v₀—v₃, v₃—v₆
+        #
+        # This is linear in the number of literals plus the edges produced.
+        for name, pos_nodes in pos_buckets.items():
+            neg_nodes = neg_buckets.get(name)
+            if not neg_nodes:
+                continue
+            for node_A in pos_nodes:
+                for node_B in neg_nodes:
+                    # Earlier occurrence first, as the pairwise scan did.
+                    if node_B.id < node_A.id:
+                        append_edge((node_B, node_A))
+                    else:
+                        append_edge((node_A, node_B))
+                    if self.DEBUG:
+                        self._debug_print(
+                            f"  Connected complementary literals '{node_A.name}' ↔ '{node_B.name}' "
+                            f"via nodes {node_A.id} and {node_B.id}.")
+
+        self.problem2.element.add_edges_from(edges_out)
+        self.add_input1_to_input2_bulk(map_pairs)
+        if self.DEBUG:
+            self._debug_print(f"Added {len(edges_out)} edge(s) to the graph.")
 
         self._debug_print("Finished input1_to_input2.\n")
 
     # ---------------------------------------------------------------------
     # 3.  Convert SAT‑assignment → Independent Set
     # ---------------------------------------------------------------------
-    def solution1_to_solution2(self):
-        """Given a satisfying *sat_assignment* (dict var→bool) return the set
-        of graph nodes that constitutes the corresponding **independent set**.
+    def solution1_to_solution2(self, sat_assignment=None):
+        """Given a satisfying *sat_assignment* return the frozenset of graph
+        nodes that constitutes the corresponding **independent set**.
+
+        Parameters
+        ----------
+        sat_assignment : dict[str, bool] | sequence of bool, optional
+            Either a mapping var→bool, or a dense sequence / bool array
+            indexed like the sorted variable names of ϕ.  Defaults to
+            *self.problem1.solution*.
 
         Notes
         -----
@@ -205,53 +278,120 @@ class ThreeSatToIndependentSetReduction(Reduction):
         • Because complementary literals are connected, the set is indeed
           independent as long as the assignment satisfies the formula.
         """
-        self._debug_print("Starting sol1_to_sol2 (SAT → IS) conversion…")
+        self._debug_print("Starting solution1_to_solution2 (SAT → IS) conversion…")
+        self._require_graph()
 
-        sat_assignment = self.problem1.solution
-        print("sat_assignment:", sat_assignment)
+        if sat_assignment is None:
+            sat_assignment = self.problem1.solution
+        if self.DEBUG:
+            self._debug_print(f"sat_assignment: {sat_assignment}")
+
+        # Fast path: a full assignment with debug tracing off is resolved
+        # with a handful of numpy operations over all clauses at once.
+        chosen_nodes = None
+        if not self.DEBUG and self._clause_var_idx is not None:
+            vals = self._as_dense(sat_assignment)
+            if vals is not None:
+                chosen_nodes = self._choose_nodes_dense(vals)
+
+        if chosen_nodes is None:
+            if not isinstance(sat_assignment, dict):
+                # The loop below looks variables up by name.
+                sat_assignment = dict(zip(self._all_var_names_sorted,
+                                          self._as_dense(sat_assignment).tolist()))
+
+            chosen_nodes = []  # One node per satisfied clause
+            get = sat_assignment.__getitem__
+
+            # Iterate clause‑by‑clause to choose *one* node per satisfied clause,
+            # reading the (name, is_negated, node) triples built in input1_to_input2().
+            for clause_idx, clause_flat in enumerate(self._clauses_flat, start=1):
+                chosen_node = None  # Reset for this clause
+                if self.DEBUG:
+                    self._debug_print(f"  Evaluating Clause #{clause_idx}…")
+
+                for var_id, is_negated, node in clause_flat:
+                    assigned_val = get(var_id)
+
+                    if self.DEBUG:
+                        self._debug_print(
+                            f"    Checking literal {node.name}: assignment[{var_id}]={assigned_val}, "
+                            f"is_negated={is_negated}")
+
+                    # A literal is satisfied (true) when its sign matches the assignment.
+                    #   • Positive  literal  x  ⇒  true  if  assigned_val == True
+                    #   • Negated   literal ¬x  ⇒  true  if  assigned_val == False
+                    # Hence we include the node exactly when
+                    #       bool(assigned_val) != is_negated
+                    # where `is_negated` is 1 for ¬x and 0 for x, i.e. a single
+                    # XOR on the value's truthiness -- the same coercion
+                    # _as_dense applies on the fast path.
+                    if bool(assigned_val) ^ is_negated:
+                        chosen_node = node
+
+                        if self.DEBUG:
+                            self._debug_print(
+                                f"    → Literal {node.name} is satisfied; picking node {node.id}.")
+                        break  # Only need *one* per clause
+
+                # After scanning the three literals:
+                if chosen_node:
+                    chosen_nodes.append(chosen_node)
+                else:
+                    # Should not happen if *sat_assignment* truly satisfies ϕ
+                    if self.DEBUG:
+                        self._debug_print(f"    No satisfied literal found in Clause #{clause_idx}.")
+
+        # Each clause contributes a distinct node, so the set is built once
+        # here rather than grown with .add() inside the loop.
+        independent_set = frozenset(chosen_nodes)
+        if self.DEBUG:
+            self._debug_print(f"Constructed Independent Set: {[n.id for n in chosen_nodes]}\n")
+        self._debug_print("Finished solution1_to_solution2.\n")
+        return independent_set
 
-        independent_set = set()  # The resulting node set
-        formula_list = self.problem1.element.clauses
+    def _as_dense(self, sat_assignment):
+        """Return *sat_assignment* as a bool array indexed like
+        ``self._all_var_names_sorted``.
 
-        # Iterate clause‑by‑clause to choose *one* node per satisfied clause.
-        for clause_idx, clause in enumerate(formula_list, start=1):
-            chosen_node = None  # Reset for this clause
-            self._debug_print(f"  Evaluating Clause #{clause_idx}…")
-
-            for literal in clause.variables:
-                # Get the node info corresponding to this literal
-                node = self.input1_to_input2_pairs[literal]
-                var_id      = literal.name
-                is_negated  = literal.is_negated
-                assigned_val = sat_assignment[var_id]
-
-                self._debug_print(
-                    f"    Checking literal {literal}: assignment[{var_id}]={assigned_val}, "
-                    f"is_negated={is_negated}")
-
-                # A literal is satisfied (true) when its sign matches the assignment.
-                #   • Positive  literal  x  ⇒  true  if  assigned_val == True
-                #   • Negated   literal ¬x  ⇒  true  if  assigned_val == False
-                # Hence we include the node exactly when
-                #       assigned_val != is_negated
-                # where `is_negated` is True for ¬x and False for x.
-                if assigned_val != is_negated:
-                    chosen_node = node
+        A dict is converted (``None`` if some variable is missing from it);
+        a list / array is checked for length and used as is.
+        """
+        names = self._all_var_names_sorted
+        if isinstance(sat_assignment, dict):
+            try:
+                return np.fromiter((sat_assignment[name] for name in names),
+                                   dtype=np.bool_, count=len(names))
+            except KeyError:
+                return None
+
+        vals = np.asarray(sat_assignment, dtype=np.bool_)
+        if vals.shape != (len(names),):
+            raise ValueError(
+                f"Dense assignment must have one value per variable "
+                f"({len(names)}), got shape {vals.shape}.")
+        return vals
+
+    def _evaluate_formula_fast(self, vals):
+        """ϕ(vals) for a dense bool array: every clause has a literal whose
+        value differs from its is_negated flag."""
+        return bool((vals[self._clause_var_idx] ^ self._clause_negs).any(axis=1).all())
+
+    def _choose_nodes_dense(self, vals):
+        """Vectorised version of the clause scan in solution1_to_solution2().
+
+        *vals* is a dense bool array from _as_dense().  Returns the node of
+        the first satisfied literal of every satisfied clause.
+        """
+        # sat[c, k] is True when literal k of clause c is satisfied; argmax
+        # picks the first such literal, matching the loop's early break.
+        sat = vals[self._clause_var_idx] ^ self._clause_negs
+        first = sat.argmax(axis=1)
+        satisfied = np.flatnonzero(sat.any(axis=1))
 
-                    self._debug_print(
-                        f"    → Literal {literal} is satisfied; picking node {node.id}.")
-                    break  # Only need *one* per clause
-
-            # After scanning the three literals:
-            if chosen_node:
-                independent_set.add(chosen_node)
-            else:
-                # Should not happen if *sat_assignment* truly satisfies ϕ
-                self._debug_print(f"    No satisfied literal found in Clause #{clause_idx}.")
-
-        self._debug_print(f"Constructed Independent Set: {[n.id for n in independent_set]}\n")
-        self._debug_print("Finished sol1tosol2.\n")
-        return independent_set
+        clauses_flat = self._clauses_flat
+        return [clauses_flat[c][k][2]
+                for c, k in zip(satisfied.tolist(), first[satisfied].tolist())]
 
     # ---------------------------------------------------------------------
     # 4.  Convert Independent Set → SAT‑assignment
@@ -265,7 +405,7 @@ class ThreeSatToIndependentSetReduction(Reduction):
         -------------
         1.  **Selected nodes ⇒ True literal**
             • Every node in the independent set corresponds to one literal
-            (stored in ``self.input1_to_input2_pairs``).
+            (stored at the same index in ``self.literals`` / ``self.lit_to_node``).
             • If the literal is positive  (x)   → assign  x = True
             If the literal is negated  (¬x)  → assign  x = False
             • If the same variable is implied twice we keep the first value
@@ -283,16 +423,21 @@ class ThreeSatToIndependentSetReduction(Reduction):
             original formula exactly when the chosen independent set is
             maximal and valid.
         """
-        self._debug_print("Starting sol2tosol1 (IS → SAT) conversion…\n")
+        self._debug_print("Starting solution2_to_solution1 (IS → SAT) conversion…\n")
+        self._require_graph()
 
         sat_assignment = {}
-        formula_list = self.problem1.element.clauses
+        set_default    = sat_assignment.setdefault
+
+        # Membership is tested once per literal; compare integer node ids
+        # (cheap to hash) instead of node objects.  Plain ids are accepted too.
+        selected_ids = frozenset(getattr(n, "id", n) for n in independent_set)
 
         # ---- 4(a) Positive information: variables forced by selected nodes
         self._debug_print("Assigning variables for selected nodes in the Independent Set.")
-        for literal, node in self.input1_to_input2_pairs.items():
+        for literal, node in zip(self.literals, self.lit_to_node):
             # We only care about nodes that are selected in the solver’s answer.
-            if node in independent_set:
+            if node.id in selected_ids:
                 var = literal.name           # e.g.  "x3"
                 is_negated = literal.is_negated     # True  for  ¬x3,  False for  x3
 
@@ -313,36 +458,48 @@ class ThreeSatToIndependentSetReduction(Reduction):
                 # Therefore the first time we encounter a variable we lock in its truth value;
                 # any later occurrences just read the existing entry and leave it unchanged
 
-                sat_assignment.setdefault(var, not is_negated)
+                set_default(var, not is_negated)
 
                 # Verbose debug trace
-                self._debug_print(
-                    f"  Selected node {node.id} ⇒ literal {literal}; "
-                    f"setting {var} = {not is_negated}")
+                if self.DEBUG:
+                    self._debug_print(
+                        f"  Selected node {node.id} ⇒ literal {literal}; "
+                        f"setting {var} = {not is_negated}")
 
         # ---- 4(b) Default remaining variables to *False* so assignment is total
-        all_vars = {lit.name for clause in formula_list for lit in clause.variables}
         self._debug_print("\nEnsuring all variables are assigned (default = False).")
-        for var in sorted(all_vars):
+        for var in self._all_var_names_sorted:
             if var not in sat_assignment:
                 sat_assignment[var] = False
-                self._debug_print(f"  {var} absent from IS; defaulting {var}=False")
+                if self.DEBUG:
+                    self._debug_print(f"  {var} absent from IS; defaulting {var}=False")
 
-        self._debug_print(f"\nFinal recovered SAT Assignment: {sat_assignment}")
-        self._debug_print("Finished sol2tosol1.\n")
+        if self.DEBUG:
+            self._debug_print(f"\nFinal recovered SAT Assignment: {sat_assignment}")
+        self._debug_print("Finished solution2_to_solution1.\n")
         return sat_assignment
 
     # ---------------------------------------------------------------------
     # 5.  Quick self‑check helper (optional, for demos & unit‑tests)
     # ---------------------------------------------------------------------
-    def test_solution(self, sat_assignment):
+    def test_solution(self, sat_assignment, chosen=None):
         """Verify a *sat_assignment* by checking **both** sides:
 
         1.  Does the assignment satisfy the original 3‑CNF □? (using the
-            evaluate() method of the ThreeSATProblem wrapper)
+            evaluate() method of the ThreeSATProblem wrapper, which also
+            colours the clauses; a dense array is checked with numpy instead)
         2.  When turned into an independent set via *solution1_to_solution2*,
             is the resulting node set indeed independent in G? (via evaluate())
 
+        Parameters
+        ----------
+        sat_assignment : dict[str, bool] | sequence of bool
+            The assignment to check (see *solution1_to_solution2*).
+        chosen : iterable of Node, optional
+            The independent set already obtained from
+            ``solution1_to_solution2(sat_assignment)``.  Pass it to skip
+            recomputing it; it is trusted to match *sat_assignment*.
+
         Returns
         -------
         (bool, bool)
@@ -350,15 +507,24 @@ class ThreeSatToIndependentSetReduction(Reduction):
             • valid_independent – whether chosen set is independent in G
         """
         self._debug_print("Starting test_solution…")
+        self._require_graph()
 
         # Step 1: formula evaluation
-        satisfied = self.problem1.evaluate(sat_assignment)
-        self._debug_print(f"  Formula satisfied? {satisfied}")
+        if isinstance(sat_assignment, dict):
+            satisfied = self.problem1.evaluate(sat_assignment)
+        elif self._clause_var_idx is not None:
+            satisfied = self._evaluate_formula_fast(self._as_dense(sat_assignment))
+        else:
+            satisfied = self.problem1.evaluate(
+                dict(zip(self._all_var_names_sorted, self._as_dense(sat_assignment).tolist())))
+        if self.DEBUG:
+            self._debug_print(f"  Formula satisfied? {satisfied}")
 
         # Step 2: graph evaluation
-        chosen_set      = self.solution1_to_solution2()
-        valid_independent = self.problem2.evaluate(chosen_set)
-        self._debug_print(f"  Independent set valid? {valid_independent}")
+        chosen_set      = chosen if chosen is not None else self.solution1_to_solution2(sat_assignment)
+        valid_independent = self.problem2.evaluate([node.id for node in chosen_set])
+        if self.DEBUG:
+            self._debug_print(f"  Independent set valid? {valid_independent}")
         self._debug_print("Finished test_solution.\n")
 
         return satisfied, valid_independent
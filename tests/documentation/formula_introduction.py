@@ -9,7 +9,8 @@ if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("Formula Display Test")
-    clock = pygame.time.Clock()
+    # nothing below reacts to mouse motion, so don't wake up for it
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     # Initialize formula and parse from file
     formula_bounding_box = np.array([[100, 100], [400, 200]])
@@ -31,10 +32,12 @@ if __name__ == "__main__":
     running = True
     while running:
         screen.fill((255, 255, 255))
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
         formula.display(screen)
         pygame.display.flip()
-        clock.tick(30)
+
+        # the scene only changes on input: sleep until the next event,
+        # then take whatever else is queued; the next pass redraws once
+        for event in [pygame.event.wait()] + pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
     pygame.quit()
@@ -10,7 +10,8 @@ if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((1200, 600))
     pygame.display.set_caption("Independent Set Display Test")
-    clock = pygame.time.Clock()
+    # nothing below reacts to mouse motion, so don't wake up for it
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     # Initialize graph and parse from file
     graph_bounding_box = np.array([[100, 100], [500, 500]])
@@ -36,7 +37,13 @@ if __name__ == "__main__":
     running = True
     while running:
         screen.fill((255, 255, 255))
-        for event in pygame.event.get():
+        # the graph with default properties, displayed to the left
+        graph.display(screen)
+        pygame.display.flip()
+
+        # the scene only changes on input: sleep until the next event,
+        # then take whatever else is queued; the next pass redraws once
+        for event in [pygame.event.wait()] + pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -46,8 +53,4 @@ if __name__ == "__main__":
                 if event.key == pygame.K_s:
                     # disable solution display when 's' is pressed
                     ind_set_problem.display_solution(screen)
-        # the graph with default properties, displayed to the left
-        graph.display(screen)
-        pygame.display.flip()
-        clock.tick(30)
     pygame.quit()
@@ -43,23 +43,25 @@ def main():
     pygame.init()
     screen = pygame.display.set_mode((900, 500))
     pygame.display.set_caption("Three SAT Problem Display")
-    clock = pygame.time.Clock()
+    # nothing below reacts to mouse motion, so don't wake up for it
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     # Main loop
     running = True
     while running:
         screen.fill((255, 255, 255))  # Clear screen
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
         # Display both elements
         three_sat_problem.display_solution(screen)
         three_sat_problem2.display_solution(screen)
 
         pygame.display.flip()
-        clock.tick(30)  # Limit FPS to 30
+
+        # the scene only changes on input: sleep until the next event,
+        # then take whatever else is queued; the next pass redraws once
+        for event in [pygame.event.wait()] + pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
 
     pygame.quit()
 
@@ -1,30 +1,32 @@
 import numpy as np
 from npvis.game_manager import GameManager
+from npvis.problem import ThreeSATProblem, IndependentSetProblem
+from npvis.reduction import ThreeSatToIndependentSetReduction
 
-def main():
-    from npvis.problem import ThreeSATProblem, IndependentSetProblem
-    from npvis.reduction import ThreeSatToIndependentSetReduction
+# formula and example assignment shared by the whole script
+CLAUSES = [
+    [(1, False), (2, True), (3, True)],
+    [(1, True), (2, False), (3, True)],
+    [(1, False), (2, True), (4, True)]
+]
+SAT_ASSIGNMENT = {1: True, 2: True, 3: False, 4: False}
 
+def main():
     # 1) Create problems
     three_sat_problem = ThreeSATProblem()
     ind_set_problem = IndependentSetProblem()
 
     # 2) Load formula into ThreeSATProblem
-    clauses = [
-        [(1, False), (2, True), (3, True)],
-        [(1, True), (2, False), (3, True)],
-        [(1, False), (2, True), (4, True)]
-    ]
-    three_sat_problem.load_formula_from_tuples(clauses)
+    three_sat_problem.load_formula_from_tuples(CLAUSES)
 
     # 3) Create the reduction
     reduction = ThreeSatToIndependentSetReduction(three_sat_problem, ind_set_problem)
 
     # 4) Build graph from 3-SAT
-    reduction.build_graph_from_formula()
+    reduction.input1_to_input2()
 
     # 5) Example assignment
-    sat_assignment = {1: True, 2: True, 3: False, 4: False}
+    sat_assignment = SAT_ASSIGNMENT
 
     # 6) Check solution
     satisfied, is_valid = reduction.test_solution(sat_assignment)
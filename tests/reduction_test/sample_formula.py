@@ -0,0 +1,8 @@
+# the 3-CNF formula and example assignment shared by the reduction demos
+SAMPLE_CLAUSES = [
+    [('x1', False), ('x2', True),  ('x3', True )],  # (¬x1 ∨ x2 ∨ x3)
+    [('x1', True ), ('x2', False), ('x3', True )],  # ( x1 ∨ ¬x2 ∨ x3)
+    [('x1', False), ('x2', True),  ('x4', True )]   # (¬x1 ∨ x2 ∨ x4)
+]
+
+SAMPLE_ASSIGNMENT = {'x1': True, 'x2': True, 'x3': False, 'x4': False}
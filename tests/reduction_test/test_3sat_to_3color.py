@@ -1,7 +1,14 @@
+import os
+
+# NPVIS_HEADLESS=1 runs the reduction checks without creating a GameManager
+HEADLESS = bool(int(os.environ.get("NPVIS_HEADLESS", "0")))
+
 import numpy as np
 from npvis.game_manager import GameManager
+from tests.reduction_test.sample_formula import SAMPLE_CLAUSES, SAMPLE_ASSIGNMENT
 
-def main():
+def build_demo():
+    """Build the problems and the reduction and check them; no display."""
     # 1) Create problems
     from npvis.problem import ThreeSATProblem, ThreeColoringProblem
     from npvis.reduction import ThreeSatToThreeColoringReduction
@@ -10,12 +17,7 @@ def main():
     three_col = ThreeColoringProblem()
 
     # 2) Load a CNF formula into ThreeSATProblem
-    clauses = [
-        [('x1', False), ('x2', True),  ('x3', True )],  # (¬x1 ∨ x2 ∨ x3)
-        [('x1', True ), ('x2', False), ('x3', True )],  # ( x1 ∨ ¬x2 ∨ x3)
-        [('x1', False), ('x2', True),  ('x4', True )]   # (¬x1 ∨ x2 ∨ x4)
-    ]
-    three_sat.load_formula_from_tuples(clauses)
+    three_sat.load_formula_from_tuples(SAMPLE_CLAUSES)
     # three_sat.load_formula_from_file("sampleFormula.txt")  # Provide correct file path
 
     # 3) Create and build the reduction
@@ -23,7 +25,7 @@ def main():
     reduction.build_graph_from_formula()
 
     # 4) Pick an example SAT assignment
-    sat_assignment = {'x1': True, 'x2': True, 'x3': False, 'x4': False}
+    sat_assignment = dict(SAMPLE_ASSIGNMENT)
 
     # 5) Test forward & reverse
     sat_ok, col_ok = reduction.test_solution(sat_assignment)
@@ -40,6 +42,13 @@ def main():
     print("Recovered SAT assignment:", recovered)
     three_sat.set_solution(recovered)
 
+    return three_sat, three_col, reduction
+
+def main():
+    three_sat, three_col, reduction = build_demo()
+    if HEADLESS:
+        return
+
     # 8) Launch the interactive display
     gm = GameManager(width=1200, height=800, fps=30)
     formula_bb = np.array([[20,  50], [380, 750]])  # left pane